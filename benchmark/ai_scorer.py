@@ -5,20 +5,53 @@ Evaluates generated TOKN against the original prompt using an AI model
 to check if the circuit will actually work as intended.
 """
 
+import asyncio
+import atexit
+import hashlib
+import heapq
+import importlib.util
+import itertools
 import json
+import logging
 import os
+import random
+import re
+import time
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import Optional
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
 import argparse
 
+import numpy as np
+
+try:
+    import orjson  # Optional: much faster JSON for large batches
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env.local
 from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / '.env.local'
 load_dotenv(env_path)
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+def _json_loads(data):
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_line(obj) -> str:
+    """Serialise obj as a single JSONL line (non-ASCII kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8') + '\n'
+    return json.dumps(obj, ensure_ascii=False) + '\n'
+
+
+@dataclass(slots=True)
 class AIScoreResult:
     """Result of AI-based circuit evaluation."""
     functionality_score: int       # 0-100: Will this circuit perform the requested function?
@@ -31,59 +64,30 @@ class AIScoreResult:
     explanation: str               # Overall assessment
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Built by hand: every field is flat, so asdict()'s recursive copy is wasted work.
+        # The issues/suggestions lists are shared with this result, not copied.
+        return {
+            'functionality_score': self.functionality_score,
+            'completeness_score': self.completeness_score,
+            'correctness_score': self.correctness_score,
+            'best_practices_score': self.best_practices_score,
+            'overall_score': self.overall_score,
+            'issues': self.issues,
+            'suggestions': self.suggestions,
+            'explanation': self.explanation,
+        }
 
 
 # System prompt for AI scoring
 AI_SCORER_SYSTEM_PROMPT = """You are an expert electronics engineer evaluating circuit designs in TOKN format.
 
-## TOKN Format Specification
-
-TOKN (Token-Optimised KiCad Notation) is a compact format for representing electronic schematics:
-
-```
-# TOKN v1
-title: <descriptive schematic name>
-
-components[N]{ref,type,value,fp,x,y,w,h,a}:
-  <reference>,<type>,<value>,<footprint>,<x>,<y>,<width>,<height>,<angle>
-
-pins{REF}[N]:
-  <pin_number>,<pin_name>
-
-nets[N]{name,pins}:
-  <net_name>,"<ref.pin>,<ref.pin>,..."
-
-wires[N]{net,pts}:
-  <net_name>,"<x1> <y1>,<x2> <y2>"
-```
-
-### Field Definitions
-
-**Components Section:**
-- ref: Reference designator (R1, C1, U1, IC1, etc.)
-- type: Component type or part number
-- value: Component value (10k, 0.1u, 100n, etc.)
-- fp: Footprint (0402, 0603, 0805, SOIC-8, etc.)
-- x,y: Position in mm
-- w,h: Symbol width/height in mm
-- a: Rotation angle in degrees
-
-**Pins Section:**
-Define pin mappings for ICs and multi-pin components with their datasheet names.
-
-**Nets Section:**
-- name: Net name (power rails like +5V, GND, or signal names)
-- pins: Comma-separated list of "REF.PIN" connections
-
-**Wires Section:**
-Physical routing paths for each net.
+TOKN sections: components{ref,type,value,fp,x,y,w,h,a} (positions in mm, a = rotation), pins{REF} (pin number, datasheet name), nets{name,pins} ("REF.PIN" lists), wires{net,pts}.
 
-## Your Task
+## Task
 
-Evaluate the generated TOKN circuit against the user's prompt. Check if the circuit will actually work as intended.
+Evaluate the generated TOKN circuit against the user's prompt: will it actually work as intended?
 
-You must return a JSON object with the following structure:
+Return a JSON object with this structure:
 
 ```json
 {
@@ -97,88 +101,65 @@ You must return a JSON object with the following structure:
 }
 ```
 
-## Scoring Criteria
-
-### Functionality Score (0-100)
-**Will this circuit perform the requested function?**
-- Does the circuit topology match what was requested?
-- Are the right ICs and components used for the task?
-- Will the circuit achieve the intended purpose?
-- Are critical functional connections present?
-
-Deductions:
-- -50 if completely wrong circuit type
-- -30 if partially correct but missing key functionality
-- -20 if functional but inefficient approach
-- -10 if minor functional issues
-
-### Completeness Score (0-100)
-**Are all necessary components present?**
-- Are all required ICs included?
-- Are all power pins connected (VCC, VDD, GND, VSS)?
-- Are decoupling capacitors present? (0.1uF ceramic per IC minimum)
-- Are bulk capacitors present for power entry? (10uF+)
-- Are pull-up/pull-down resistors included where needed?
-- Are current limiting resistors present for LEDs?
-- Are necessary passive components included?
-
-Deductions:
-- -40 if power connections are missing or incomplete
-- -30 if decoupling capacitors are completely missing
-- -20 if some decoupling caps present but insufficient
-- -15 if bulk capacitors missing on power entry
-- -10 if missing pull-up/pull-down resistors where needed
-- -10 if missing current limiting resistors for LEDs
-- -5 per missing required component
-
-### Correctness Score (0-100)
-**Are connections correct for the ICs used?**
-- Are IC pins connected according to datasheet specifications?
-- Are power pins (VCC/GND) correctly identified and connected?
-- Are signal pins correctly mapped to their functions?
-- Are pin numbers correct for the IC packages used?
-- Are polarized components (capacitors, diodes, LEDs) oriented correctly?
-- Are voltage levels compatible between connected components?
-- Are current limits respected?
-
-Deductions:
-- -50 if power pins are incorrectly connected (e.g., VCC to GND)
-- -30 if critical signal pins are misconnected
-- -20 if pin numbering doesn't match IC package
-- -15 if polarized components reversed
-- -10 if voltage level mismatches exist
-- -10 per incorrect pin assignment
-
-### Best Practices Score (0-100)
-**Does it follow good design practices?**
-- Are decoupling caps placed close to IC power pins? (check x,y coordinates)
-- Are component values appropriate?
-  - Pull-ups typically 4.7k-10k
-  - LED current limiting resistors calculated for ~10-20mA
-  - Decoupling caps 0.1uF ceramic + bulk caps
-- Are net names descriptive and consistent?
-- Is the layout organized logically?
-- Are bypass capacitors the right values?
-- Are there any obvious design smells?
-
-Deductions:
-- -20 if decoupling caps are far from IC power pins (>20mm away)
-- -15 if component values are inappropriate (e.g., 100k pull-up, 100R for LED)
-- -10 if net naming is poor or confusing
-- -10 if layout is disorganized
-- -5 per minor best practice violation
-
-## Important Notes
-
-1. Be thorough but fair in your evaluation
-2. Consider that some missing details might be acceptable for a schematic
-3. Focus on whether the circuit will work electrically
-4. Check datasheet-level correctness for common ICs
-5. Provide specific, actionable feedback in issues and suggestions
-6. The explanation should be a concise summary (2-3 sentences)
+## Scoring (start at 100, apply deductions)
+
+| Score | Question | Deductions |
+|---|---|---|
+| functionality | Does the topology/IC choice perform the requested function? | -50 wrong circuit type; -30 key function missing; -20 inefficient approach; -10 minor issues |
+| completeness | Are all required parts present (ICs, power pins, 0.1uF decoupling per IC, 10uF+ bulk at power entry, pull-ups/downs, LED resistors)? | -40 power connections missing; -30 no decoupling; -20 insufficient decoupling; -15 no bulk cap; -10 missing pull-ups/downs; -10 missing LED resistors; -5 per missing part |
+| correctness | Do connections match datasheets (power pins, signal pins, pin numbers, polarity, voltage levels, current limits)? | -50 power pins wrong (e.g. VCC to GND); -30 critical signal misconnected; -20 pin numbering wrong for package; -15 polarized part reversed; -10 voltage mismatch; -10 per wrong pin |
+| best_practices | Good values and layout (decoupling near power pins per x,y; 4.7k-10k pull-ups; LEDs ~10-20mA; descriptive nets)? | -20 decoupling >20mm from pin; -15 inappropriate values (e.g. 100k pull-up, 100R LED); -10 poor net names; -10 disorganized layout; -5 per minor violation |
+
+Be thorough but fair: schematic-level omissions can be acceptable; focus on electrical correctness. Give specific, actionable issues and suggestions, and a 2-3 sentence explanation.
 
 Return ONLY the JSON object, no additional text."""
 
+# Bump whenever AI_SCORER_SYSTEM_PROMPT changes so cached scores are invalidated
+SYSTEM_PROMPT_VERSION = 2
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'tokn' / 'ai_scorer'
+
+_SCORE_FIELD = {"type": "integer", "minimum": 0, "maximum": 100}
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# JSON schema for structured outputs, matching the object described in the system prompt
+AI_SCORE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "functionality_score": _SCORE_FIELD,
+        "completeness_score": _SCORE_FIELD,
+        "correctness_score": _SCORE_FIELD,
+        "best_practices_score": _SCORE_FIELD,
+        "issues": _STRING_LIST,
+        "suggestions": _STRING_LIST,
+        "explanation": {"type": "string"},
+    },
+    "required": [
+        "functionality_score", "completeness_score", "correctness_score",
+        "best_practices_score", "issues", "suggestions", "explanation",
+    ],
+    "additionalProperties": False,
+}
+
+# Structured outputs need an object at the top level, so marshaled replies wrap the array
+AI_SCORES_SCHEMA = {
+    "type": "object",
+    "properties": {"scores": {"type": "array", "items": AI_SCORE_SCHEMA}},
+    "required": ["scores"],
+    "additionalProperties": False,
+}
+
+
+
+# Reply parsing patterns, compiled once rather than on every response
+_JSON_FENCE_RE = re.compile(r'```json\s*\n(.*?)\n```', re.DOTALL)
+_JSON_BRACE_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+_SCORE_FIELD_RES = [
+    (re.compile(rf'"{key}"\s*:\s*(\d+)'), key)
+    for key in ['functionality_score', 'completeness_score', 'correctness_score', 'best_practices_score']
+]
+
 
 def extract_partial_scores(json_text: str) -> dict:
     """Extract scores from truncated JSON using regex.
@@ -186,20 +167,11 @@ def extract_partial_scores(json_text: str) -> dict:
     When the AI response is cut off mid-way through the issues/suggestions arrays,
     we can still extract the numeric scores which appear at the start of the JSON.
     """
-    import re
-
     scores = {}
 
     # Extract each score field
-    patterns = [
-        (r'"functionality_score"\s*:\s*(\d+)', 'functionality_score'),
-        (r'"completeness_score"\s*:\s*(\d+)', 'completeness_score'),
-        (r'"correctness_score"\s*:\s*(\d+)', 'correctness_score'),
-        (r'"best_practices_score"\s*:\s*(\d+)', 'best_practices_score'),
-    ]
-
-    for pattern, key in patterns:
-        match = re.search(pattern, json_text)
+    for pattern, key in _SCORE_FIELD_RES:
+        match = pattern.search(json_text)
         if match:
             scores[key] = int(match.group(1))
 
@@ -220,11 +192,369 @@ def extract_partial_scores(json_text: str) -> dict:
     )
 
 
+# Static pieces of the user message. The prompt and TOKN are sent as separate
+# text parts between them, so the (potentially large) circuit is never copied
+# into a concatenated message string before JSON encoding.
+_USER_PREFIX = "Please evaluate this TOKN circuit design.\n\n"
+_PROMPT_HEADER = "**Original Prompt:**\n"
+_TOKN_HEADER = "\n\n**Generated TOKN:**\n```\n"
+_TOKN_FOOTER = "\n```"
+_USER_SUFFIX = "\n\nEvaluate the circuit and return ONLY a JSON object with your assessment."
+
+
+def _text_parts(*texts: str) -> list[dict]:
+    """Wrap strings as chat message content parts."""
+    return [{"type": "text", "text": text} for text in texts]
+
+
+def _build_user_message(prompt: str, generated_tokn: str) -> list[dict]:
+    """Build the user message content sent alongside the scorer system prompt."""
+    return _text_parts(
+        _USER_PREFIX, _PROMPT_HEADER, prompt,
+        _TOKN_HEADER, generated_tokn, _TOKN_FOOTER, _USER_SUFFIX,
+    )
+
+
+def _build_marshaled_message(circuits: list[tuple[str, str]]) -> list[dict]:
+    """Build one user message asking for several circuits to be scored at once.
+
+    The shared system prompt is left untouched so it stays identical across
+    requests; the array-output instruction lives here instead.
+    """
+    count = len(circuits)
+    texts = [f"Please evaluate the following {count} TOKN circuit designs."]
+    for n, (prompt, generated_tokn) in enumerate(circuits, 1):
+        texts += [
+            f"\n\n[{n}]\n", _PROMPT_HEADER, prompt,
+            _TOKN_HEADER, generated_tokn, _TOKN_FOOTER,
+        ]
+    texts.append(
+        f"\n\nEvaluate each circuit independently and return ONLY a JSON object "
+        f"{{\"scores\": [...]}} whose array holds {count} objects, one per circuit in the "
+        f"order given, each with the structure described above."
+    )
+    return _text_parts(*texts)
+
+
+def _score_from_dict(result: dict) -> AIScoreResult:
+    """Build an AIScoreResult from a parsed score object, computing the weighted overall."""
+    # Calculate overall score (weighted average)
+    overall = (
+        result['functionality_score'] * 0.35 +
+        result['completeness_score'] * 0.25 +
+        result['correctness_score'] * 0.25 +
+        result['best_practices_score'] * 0.15
+    )
+
+    return AIScoreResult(
+        functionality_score=result['functionality_score'],
+        completeness_score=result['completeness_score'],
+        correctness_score=result['correctness_score'],
+        best_practices_score=result['best_practices_score'],
+        overall_score=round(overall, 2),
+        issues=result.get('issues', []),
+        suggestions=result.get('suggestions', []),
+        explanation=result.get('explanation', '')
+    )
+
+
+def _parse_score_response(response_text: str) -> tuple[AIScoreResult, bool]:
+    """Parse the scorer model's reply into an AIScoreResult.
+
+    Returns (result, complete): complete is False when the reply was truncated
+    and only the scores could be recovered (no issues/suggestions), in which
+    case the result should not be cached.
+
+    Raises json.JSONDecodeError if no scores can be recovered.
+    """
+    # Fast path: a bare JSON object needs no searching
+    if response_text.startswith('{') and response_text.endswith('}'):
+        json_text = response_text
+    else:
+        # Extract JSON from response (may be wrapped in ```json```)
+        json_match = _JSON_FENCE_RE.search(response_text)
+        if json_match:
+            json_text = json_match.group(1)
+        else:
+            # Try to find JSON object directly
+            json_match = _JSON_BRACE_RE.search(response_text)
+            json_text = json_match.group(0) if json_match else response_text
+
+    # Parse the JSON response - try full parse first, then partial
+    try:
+        result = _json_loads(json_text)
+        complete = True
+    except json.JSONDecodeError:
+        # Try to extract scores from truncated JSON using regex
+        result = extract_partial_scores(json_text)
+        complete = False
+
+    return _score_from_dict(result), complete
+
+
+def _parse_marshaled_response(response_text: str, count: int) -> list[AIScoreResult]:
+    """Parse a {"scores": [...]} (or bare array) reply covering `count` circuits, in request order.
+
+    Raises ValueError (including json.JSONDecodeError), KeyError or TypeError
+    if the reply is not an array of `count` complete score objects.
+    """
+    if (response_text.startswith('{') and response_text.endswith('}')) or \
+            (response_text.startswith('[') and response_text.endswith(']')):
+        json_text = response_text
+    else:
+        json_match = _JSON_FENCE_RE.search(response_text)
+        if json_match:
+            json_text = json_match.group(1)
+        else:
+            json_match = _JSON_ARRAY_RE.search(response_text)
+            json_text = json_match.group(0) if json_match else response_text
+
+    results = _json_loads(json_text)
+    if isinstance(results, dict):
+        results = results['scores']
+    if not isinstance(results, list) or len(results) != count:
+        raise ValueError(f"Expected a JSON array of {count} score objects")
+    return [_score_from_dict(result) for result in results]
+
+
+def _failed_result(issue: str, explanation: str) -> AIScoreResult:
+    """Zero-score result used when a circuit could not be scored."""
+    return AIScoreResult(
+        functionality_score=0,
+        completeness_score=0,
+        correctness_score=0,
+        best_practices_score=0,
+        overall_score=0.0,
+        issues=[issue],
+        suggestions=[],
+        explanation=explanation
+    )
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """Return the OpenRouter API key, falling back to the environment."""
+    if api_key is None:
+        api_key = os.environ.get('OPENROUTER_API_KEY')
+
+    if not api_key:
+        raise ValueError(
+            "OPENROUTER_API_KEY not found. "
+            "Set it in .env.local or pass as api_key parameter. "
+            "Get your key from https://openrouter.ai/keys"
+        )
+    return api_key
+
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+OPENROUTER_HEADERS = {
+    "HTTP-Referer": "https://github.com/MichaelAyles/tokn",
+    "X-Title": "TOKN AI Scorer"
+}
+
+
+def _system_message(model: str) -> dict:
+    """System message, marked as a prompt-cache breakpoint for Anthropic models.
+
+    OpenAI and Gemini cache long static prefixes automatically, so the prompt
+    must stay byte-identical across calls for the cache to hit.
+    """
+    if model.startswith("anthropic/"):
+        return {
+            "role": "system",
+            "content": [{
+                "type": "text",
+                "text": AI_SCORER_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }],
+        }
+    return {"role": "system", "content": AI_SCORER_SYSTEM_PROMPT}
+
+
+# Prompt token usage across the requests of a run, for checking cache hit rate
+_prompt_usage = {"prompt_tokens": 0, "cached_tokens": 0}
+
+
+def _record_usage(usage: Optional[dict]) -> None:
+    """Add a response's usage block to the prompt-cache totals."""
+    if not usage:
+        return
+    details = usage.get("prompt_tokens_details") or {}
+    _prompt_usage["prompt_tokens"] += usage.get("prompt_tokens") or 0
+    _prompt_usage["cached_tokens"] += details.get("cached_tokens") or 0
+
+
+def _print_cache_usage() -> None:
+    """Print how many prompt tokens were served from the provider's prompt cache."""
+    total = _prompt_usage["prompt_tokens"]
+    if total:
+        cached = _prompt_usage["cached_tokens"]
+        print(f"Prompt cache: {cached}/{total} prompt tokens cached ({100 * cached / total:.1f}%)")
+
+
+# Models that rejected structured outputs: 1 = use json_object, 2 = no response_format
+_response_format_fallback: dict[str, int] = {}
+
+
+def _response_format(model: str, marshaled: bool = False) -> dict:
+    """response_format request field: strict JSON schema unless the model rejected it."""
+    level = _response_format_fallback.get(model, 0)
+    if level == 0:
+        return {"response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "ai_scores" if marshaled else "ai_score",
+                "schema": AI_SCORES_SCHEMA if marshaled else AI_SCORE_SCHEMA,
+                "strict": True,
+            },
+        }}
+    if level == 1:
+        return {"response_format": {"type": "json_object"}}
+    return {}
+
+
+def _is_response_format_error(status: Optional[int], message: str) -> bool:
+    """Whether an API error looks like the provider rejecting response_format."""
+    message = message.lower()
+    return status == 400 and any(
+        word in message for word in ("response_format", "json_schema", "structured output", "json mode")
+    )
+
+
+def _downgrade_response_format(body: dict) -> Optional[dict]:
+    """Remember that body's model rejected its response_format and return a body with a weaker one.
+
+    Returns None if the body had no response_format left to drop.
+    """
+    response_format = body.get("response_format")
+    if response_format is None:
+        return None
+    model = body["model"]
+    if response_format["type"] == "json_schema":
+        _response_format_fallback[model] = 1
+        downgraded = {**body, "response_format": {"type": "json_object"}}
+    else:
+        _response_format_fallback[model] = 2
+        downgraded = {k: v for k, v in body.items() if k != "response_format"}
+    new_type = downgraded.get("response_format", {}).get("type", "none")
+    logger.warning(f"{model} rejected response_format {response_format['type']}, using {new_type}")
+    return downgraded
+
+
+def _request_body(user_message: list[dict], model: str, max_tokens: int = 8192,
+                  marshaled: bool = False) -> dict:
+    """JSON body for /chat/completions, shared by the SDK and aiohttp paths."""
+    return {
+        "model": model,
+        "messages": [
+            _system_message(model),
+            {"role": "user", "content": user_message}
+        ],
+        "temperature": 0.1,  # Low temperature for consistent scoring
+        "max_tokens": max_tokens,
+        **_response_format(model, marshaled),
+    }
+
+
+def _provider_preferences(provider_sort: Optional[str]) -> dict:
+    """OpenRouter provider routing fields to merge into the request body.
+
+    provider_sort is one of 'throughput', 'price' or 'latency'; None keeps
+    OpenRouter's default routing.
+    """
+    if not provider_sort:
+        return {}
+    return {"provider": {"sort": provider_sort}}
+
+
+class APIStatusError(Exception):
+    """Non-success response from the chat completions endpoint."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+
+def _cache_key(model: str, prompt: str, generated_tokn: str) -> str:
+    """Content hash identifying a (model, prompt, circuit) score in the cache."""
+    key = "\0".join([model, prompt, generated_tokn, str(SYSTEM_PROMPT_VERSION)])
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def _cache_load(cache_dir: Optional[Path], key: str) -> Optional[AIScoreResult]:
+    """Return the cached score for key, or None on a miss (or if caching is off)."""
+    if cache_dir is None:
+        return None
+    try:
+        with open(Path(cache_dir) / f"{key}.json", 'r', encoding='utf-8') as f:
+            return AIScoreResult(**_json_loads(f.read()))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _cache_store(cache_dir: Optional[Path], key: str, result: AIScoreResult) -> None:
+    """Atomically write a successful score to the cache.
+
+    Best-effort: a failed write (disk full, read-only or unwritable directory)
+    is logged and otherwise ignored, so the score itself is never lost.
+    """
+    if cache_dir is None:
+        return
+    cache_dir = Path(cache_dir)
+    path = cache_dir / f"{key}.json"
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(_json_line(result.to_dict()))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write score cache {path}: {e}")
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+# OpenRouter clients by API key, reused so repeated calls keep their pooled connections
+_CLIENTS: dict = {}
+
+
+def _get_client(api_key: str):
+    """Return the shared openai.OpenAI client for api_key, creating it on first use."""
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        import openai
+
+        # Optional: with h2 installed httpx can negotiate HTTP/2
+        http2 = importlib.util.find_spec('h2') is not None
+
+        client = openai.OpenAI(
+            base_url=OPENROUTER_BASE_URL,
+            api_key=api_key,
+            timeout=120,
+            http_client=openai.DefaultHttpxClient(http2=http2),
+        )
+        if not _CLIENTS:
+            atexit.register(_close_clients)
+        _CLIENTS[api_key] = client
+    return client
+
+
+def _close_clients() -> None:
+    """Close the shared clients' connection pools at interpreter exit."""
+    for client in _CLIENTS.values():
+        client.close()
+    _CLIENTS.clear()
+
+
 def ai_score_circuit(
     prompt: str,
     generated_tokn: str,
     model: str = "google/gemini-2.5-flash",
-    api_key: str = None
+    api_key: str = None,
+    provider_sort: Optional[str] = None,
+    cache_dir: Optional[Path] = None
 ) -> AIScoreResult:
     """
     Score a generated TOKN circuit using an AI model.
@@ -234,221 +564,898 @@ def ai_score_circuit(
         generated_tokn: The generated TOKN circuit
         model: Model to use for scoring (default: google/gemini-2.5-flash)
         api_key: API key for OpenRouter (defaults to OPENROUTER_API_KEY env var)
+        provider_sort: OpenRouter provider ordering (throughput, price or latency),
+            or None (the default) for OpenRouter's default routing
+        cache_dir: Directory of cached scores, or None (the default) to always call
+            the API; the CLI uses DEFAULT_CACHE_DIR
 
     Returns:
         AIScoreResult with scores and feedback
     """
+    cache_key = _cache_key(model, prompt, generated_tokn)
+    cached = _cache_load(cache_dir, cache_key)
+    if cached is not None:
+        return cached
+
     try:
         import openai
     except ImportError:
         raise ImportError("openai package required. Run: pip install openai")
 
-    if api_key is None:
-        api_key = os.environ.get('OPENROUTER_API_KEY')
+    client = _get_client(_resolve_api_key(api_key))
 
-    if not api_key:
-        raise ValueError(
-            "OPENROUTER_API_KEY not found. "
-            "Set it in .env.local or pass as api_key parameter. "
-            "Get your key from https://openrouter.ai/keys"
-        )
+    response_text = ""
+    try:
+        body = _request_body(_build_user_message(prompt, generated_tokn), model)
+        while True:
+            try:
+                response = client.chat.completions.create(
+                    **body,
+                    extra_headers=OPENROUTER_HEADERS,
+                    extra_body=_provider_preferences(provider_sort)
+                )
+                break
+            except openai.BadRequestError as e:
+                downgraded = None
+                if _is_response_format_error(e.status_code, str(e)):
+                    downgraded = _downgrade_response_format(body)
+                if downgraded is None:
+                    raise
+                body = downgraded
+        response_text = response.choices[0].message.content.strip()
+        if response.usage is not None:
+            _record_usage(response.usage.model_dump())
+        result, complete = _parse_score_response(response_text)
+        if complete:
+            _cache_store(cache_dir, cache_key, result)
+        return result
 
-    client = openai.OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-    )
+    except json.JSONDecodeError as e:
+        print(f"Error parsing AI response as JSON: {e}")
+        print(f"Response was: {response_text[:500]}")
+        return _failed_result(
+            "Failed to parse AI scorer response",
+            f"AI scorer returned invalid JSON: {str(e)}"
+        )
+    except Exception as e:
+        print(f"Error calling AI scorer: {e}")
+        return _failed_result(
+            f"AI scorer API error: {str(e)}",
+            f"Failed to score circuit: {str(e)}"
+        )
 
-    # Construct the user message
-    user_message = f"""Please evaluate this TOKN circuit design.
 
-**Original Prompt:**
-{prompt}
+def _make_session(api_key: str):
+    """Create the aiohttp session shared by every request in a batch."""
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("aiohttp package required for batch scoring. Run: pip install aiohttp")
 
-**Generated TOKN:**
-```
-{generated_tokn}
-```
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=128, limit_per_host=128, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=120),
+        headers={"Authorization": f"Bearer {api_key}", **OPENROUTER_HEADERS},
+    )
 
-Evaluate the circuit and return ONLY a JSON object with your assessment."""
 
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": AI_SCORER_SYSTEM_PROMPT},
-                {"role": "user", "content": user_message}
-            ],
-            temperature=0.1,  # Low temperature for consistent scoring
-            max_tokens=8192,
-            extra_headers={
-                "HTTP-Referer": "https://github.com/MichaelAyles/tokn",
-                "X-Title": "TOKN AI Scorer"
-            }
-        )
+async def _post_chat_completion(session, body: dict) -> str:
+    """POST a chat completion and return the reply text. API errors propagate.
 
-        response_text = response.choices[0].message.content.strip()
+    If the provider rejects the structured-output response_format, the request
+    is repeated with a weaker one (json_schema -> json_object -> none).
+    """
+    while True:
+        try:
+            return await _post_chat_completion_once(session, body)
+        except APIStatusError as e:
+            downgraded = None
+            if _is_response_format_error(e.status, str(e)):
+                downgraded = _downgrade_response_format(body)
+            if downgraded is None:
+                raise
+            body = downgraded
+
+
+async def _post_chat_completion_once(session, body: dict) -> str:
+    """POST a single chat completion and return the reply text."""
+    async with session.post(f"{OPENROUTER_BASE_URL}/chat/completions", json=body) as response:
+        if response.status != 200:
+            raise APIStatusError(response.status, (await response.text())[:500])
+        data = await response.json(content_type=None)
+
+    # OpenRouter can report upstream failures inside a 200 response
+    if 'error' in data:
+        error = data['error']
+        raise APIStatusError(int(error.get('code') or 502), str(error.get('message', error)))
+
+    _record_usage(data.get('usage'))
+    return (data['choices'][0]['message']['content'] or '').strip()
+
+
+async def _request_score_async(
+    session,
+    prompt: str,
+    generated_tokn: str,
+    model: str,
+    provider_sort: Optional[str] = None
+) -> tuple[AIScoreResult, bool]:
+    """Score one circuit. API and JSON errors propagate to the caller.
 
-        # Extract JSON from response (may be wrapped in ```json```)
-        import re
-        json_match = re.search(r'```json\s*\n(.*?)\n```', response_text, re.DOTALL)
-        if json_match:
-            json_text = json_match.group(1)
-        else:
-            # Try to find JSON object directly
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_text = json_match.group(0)
-            else:
-                json_text = response_text
+    Returns (result, complete) as from _parse_score_response.
+    """
+    response_text = await _post_chat_completion(session, {
+        **_request_body(_build_user_message(prompt, generated_tokn), model),
+        **_provider_preferences(provider_sort),
+    })
+    try:
+        return _parse_score_response(response_text)
+    except json.JSONDecodeError:
+        logger.debug(f"Response was: {response_text[:500]}")
+        raise
+
+
+async def _request_marshaled_async(
+    session,
+    circuits: list[tuple[str, str]],
+    model: str,
+    provider_sort: Optional[str] = None
+) -> list[AIScoreResult]:
+    """Score several (prompt, tokn) circuits in one request. Errors propagate."""
+    response_text = await _post_chat_completion(session, {
+        **_request_body(
+            _build_marshaled_message(circuits), model,
+            max_tokens=max(8192, 2048 * len(circuits)),
+            marshaled=True
+        ),
+        **_provider_preferences(provider_sort),
+    })
+    return _parse_marshaled_response(response_text, len(circuits))
+
+
+async def ai_score_circuit_async(
+    prompt: str,
+    generated_tokn: str,
+    model: str = "google/gemini-2.5-flash",
+    api_key: str = None,
+    session=None,
+    provider_sort: Optional[str] = None
+) -> AIScoreResult:
+    """
+    Async variant of ai_score_circuit for concurrent batch scoring.
 
-        # Parse the JSON response - try full parse first, then partial
-        result = None
-        try:
-            result = json.loads(json_text)
-        except json.JSONDecodeError:
-            # Try to extract scores from truncated JSON using regex
-            result = extract_partial_scores(json_text)
-
-        # Calculate overall score (weighted average)
-        overall = (
-            result['functionality_score'] * 0.35 +
-            result['completeness_score'] * 0.25 +
-            result['correctness_score'] * 0.25 +
-            result['best_practices_score'] * 0.15
-        )
+    Args:
+        prompt: The original user prompt
+        generated_tokn: The generated TOKN circuit
+        model: Model to use for scoring
+        api_key: API key for OpenRouter (ignored if session is given)
+        session: Optional shared aiohttp.ClientSession from _make_session
+        provider_sort: OpenRouter provider ordering (throughput, price or latency)
 
-        return AIScoreResult(
-            functionality_score=result['functionality_score'],
-            completeness_score=result['completeness_score'],
-            correctness_score=result['correctness_score'],
-            best_practices_score=result['best_practices_score'],
-            overall_score=round(overall, 2),
-            issues=result.get('issues', []),
-            suggestions=result.get('suggestions', []),
-            explanation=result.get('explanation', '')
-        )
+    Returns:
+        AIScoreResult with scores and feedback
+    """
+    owns_session = session is None
+    if owns_session:
+        session = _make_session(_resolve_api_key(api_key))
 
+    try:
+        result, _ = await _request_score_async(session, prompt, generated_tokn, model, provider_sort)
+        return result
     except json.JSONDecodeError as e:
         print(f"Error parsing AI response as JSON: {e}")
-        print(f"Response was: {response_text[:500]}")
-        # Return a default failure result
-        return AIScoreResult(
-            functionality_score=0,
-            completeness_score=0,
-            correctness_score=0,
-            best_practices_score=0,
-            overall_score=0.0,
-            issues=["Failed to parse AI scorer response"],
-            suggestions=[],
-            explanation=f"AI scorer returned invalid JSON: {str(e)}"
+        return _failed_result(
+            "Failed to parse AI scorer response",
+            f"AI scorer returned invalid JSON: {str(e)}"
         )
     except Exception as e:
         print(f"Error calling AI scorer: {e}")
-        return AIScoreResult(
-            functionality_score=0,
-            completeness_score=0,
-            correctness_score=0,
-            best_practices_score=0,
-            overall_score=0.0,
-            issues=[f"AI scorer API error: {str(e)}"],
-            suggestions=[],
-            explanation=f"Failed to score circuit: {str(e)}"
+        return _failed_result(
+            f"AI scorer API error: {str(e)}",
+            f"Failed to score circuit: {str(e)}"
         )
+    finally:
+        if owns_session:
+            await session.close()
 
 
-def ai_score_batch(
-    results_jsonl_path: str,
-    output_path: str,
-    model: str = "google/gemini-2.5-flash",
-    limit: int = None,
-    api_key: str = None
-) -> None:
+def _estimate_tokens(prompt: str, generated_tokn: str) -> int:
+    """Rough token cost of one scoring request, used for TPM throttling."""
+    return len(prompt) // 4 + len(generated_tokn) // 4 + 2048
+
+
+def _is_retryable(error: Exception) -> bool:
+    """True for rate limits, server errors and transport failures."""
+    import aiohttp
+
+    if isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status == 429 or error.status >= 500
+    return False
+
+
+@dataclass
+class _ScoreJob:
+    """One circuit waiting to be scored."""
+    index: int
+    row: dict
+    prompt: str
+    generated_tokn: str
+    token_estimate: int
+
+
+@dataclass
+class _ScoreRequest:
+    """One API call covering one or more circuits, tracked by the dispatcher."""
+    jobs: list[_ScoreJob]
+    attempts_left: int
+    not_before: float = 0.0  # time.monotonic() before which a retry isn't sent
+
+    @property
+    def token_estimate(self) -> int:
+        return sum(job.token_estimate for job in self.jobs)
+
+
+async def _score_results_async(
+    results: Iterable[dict],
+    model: str,
+    api_key: Optional[str],
+    concurrency: int,
+    max_requests_per_minute: float,
+    max_tokens_per_minute: float,
+    max_attempts: int = 5,
+    on_result=None,
+    provider_sort: Optional[str] = None,
+    marshal_batch: int = 1,
+    cache_dir: Optional[Path] = None
+) -> list[AIScoreResult]:
     """
-    Score a batch of results from a JSONL file.
+    Score all results concurrently within request and token rate limits.
+
+    Follows the openai-cookbook parallel processor: request and token
+    capacity refill continuously up to the per-minute limits, and a request
+    is only handed to the worker pool when both can cover it. Rate limits and server errors
+    are retried with exponential backoff up to max_attempts; a request waiting
+    out its backoff is held by the dispatcher, so its worker moves on.
+
+    With marshal_batch > 1, circuits are packed into groups that are scored
+    in a single call; a group whose reply cannot be matched back to its
+    circuits is split and rescored one circuit at a time.
+
+    Rows are pulled from results lazily as capacity frees up, so a streaming
+    iterator only keeps in-flight rows in memory.
 
     Args:
-        results_jsonl_path: Path to benchmark results JSONL file
-        output_path: Path to save AI scores JSON file
+        results: Benchmark result rows with 'prompt' and 'generated_tokn'
+            (any iterable, consumed once)
         model: Model to use for scoring
-        limit: Optional limit on number of results to score
         api_key: Optional API key (defaults to env var)
+        concurrency: Number of workers, i.e. maximum requests in flight at once
+        max_requests_per_minute: Request budget per minute
+        max_tokens_per_minute: Estimated token budget per minute
+        max_attempts: Attempts per request before giving up
+        on_result: Optional callback(index, row, AIScoreResult) run as each circuit finishes
+        provider_sort: OpenRouter provider ordering (throughput, price or latency)
+        marshal_batch: Number of circuits to score per request
+        cache_dir: Directory of cached scores, or None to always call the API
+
+    Returns:
+        AIScoreResults in the same order as results
     """
-    # Load results
-    with open(results_jsonl_path, 'r', encoding='utf-8') as f:
-        results = [json.loads(line) for line in f]
+    scores: dict[int, AIScoreResult] = {}
+
+    def finish(index: int, row: dict, ai_score: AIScoreResult) -> None:
+        scores[index] = ai_score
+        if on_result is not None:
+            on_result(index, row, ai_score)
+
+    def make_requests():
+        """Turn rows into API requests, settling empty and cached rows on the way."""
+        group_size = max(1, marshal_batch)
+        group = []
+        for i, result in enumerate(results):
+            generated_tokn = result['generated_tokn']
+            if not generated_tokn or not generated_tokn.strip():
+                finish(i, result, _failed_result("No TOKN was generated", "Circuit generation failed"))
+                continue
+
+            cached = _cache_load(cache_dir, _cache_key(model, result['prompt'], generated_tokn))
+            if cached is not None:
+                finish(i, result, cached)
+                continue
+
+            group.append(_ScoreJob(
+                index=i,
+                row=result,
+                prompt=result['prompt'],
+                generated_tokn=generated_tokn,
+                token_estimate=_estimate_tokens(result['prompt'], generated_tokn),
+            ))
+            if len(group) == group_size:
+                yield _ScoreRequest(jobs=group, attempts_left=max_attempts)
+                group = []
+        if group:
+            yield _ScoreRequest(jobs=group, attempts_left=max_attempts)
+
+    session = _make_session(_resolve_api_key(api_key))
+
+    # Bounded hand-off to a fixed pool of workers: memory stays O(workers)
+    # however many rows the input has
+    worker_count = max(1, concurrency)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2 * worker_count)
+    # Requests to send again, as a heap of (not_before, sequence, request):
+    # a request backing off stays here rather than holding a worker
+    retries: list[tuple[float, int, _ScoreRequest]] = []
+    retry_sequence = itertools.count()
+    request_iter = make_requests()
+    exhausted = False
+    outstanding = 0  # Requests handed to workers and not yet settled
+    available_request_capacity = max_requests_per_minute
+    available_token_capacity = max_tokens_per_minute
+    last_update = time.monotonic()
+
+    def requeue(request: _ScoreRequest) -> None:
+        heapq.heappush(retries, (request.not_before, next(retry_sequence), request))
+
+    async def score(request: _ScoreRequest) -> None:
+        nonlocal outstanding
+        try:
+            if len(request.jobs) == 1:
+                job = request.jobs[0]
+                ai_score, complete = await _request_score_async(
+                    session, job.prompt, job.generated_tokn, model, provider_sort
+                )
+                ai_scores = [ai_score]
+            else:
+                ai_scores = await _request_marshaled_async(
+                    session,
+                    [(job.prompt, job.generated_tokn) for job in request.jobs],
+                    model, provider_sort
+                )
+                complete = True  # Marshaled replies are only accepted when fully parsed
+        except (ValueError, KeyError, TypeError) as e:
+            # Unusable reply (json.JSONDecodeError is a ValueError)
+            if len(request.jobs) > 1:
+                ai_scores = None
+            else:
+                logger.warning(f"Error parsing AI response as JSON: {e}")
+                ai_scores = [_failed_result(
+                    "Failed to parse AI scorer response",
+                    f"AI scorer returned invalid JSON: {str(e)}"
+                )]
+        except Exception as e:
+            request.attempts_left -= 1
+            if _is_retryable(e) and request.attempts_left > 0:
+                attempt = max_attempts - request.attempts_left
+                delay = 2 ** attempt + random.random()
+                first = request.jobs[0].index + 1
+                logger.warning(f"Retrying circuit {first} ({len(request.jobs)} in request) in {delay:.1f}s: {e}")
+                request.not_before = time.monotonic() + delay
+                outstanding -= 1
+                requeue(request)
+                return
+            logger.warning(f"Error calling AI scorer: {e}")
+            ai_scores = [
+                _failed_result(
+                    f"AI scorer API error: {str(e)}",
+                    f"Failed to score circuit: {str(e)}"
+                )
+                for _ in request.jobs
+            ]
+        else:
+            if complete:
+                for job, ai_score in zip(request.jobs, ai_scores):
+                    _cache_store(cache_dir, _cache_key(model, job.prompt, job.generated_tokn), ai_score)
+
+        outstanding -= 1
+        if ai_scores is None:
+            # Marshaled reply didn't line up with its circuits - score them individually
+            logger.warning(f"Could not parse {len(request.jobs)}-circuit reply, rescoring individually")
+            for job in request.jobs:
+                requeue(_ScoreRequest(jobs=[job], attempts_left=max_attempts))
+            return
+
+        for job, ai_score in zip(request.jobs, ai_scores):
+            finish(job.index, job.row, ai_score)
+
+    async def worker() -> None:
+        while True:
+            request = await queue.get()
+            try:
+                if request is None:
+                    return
+                await score(request)
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+
+    def check_workers() -> None:
+        for task in workers:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
+    async def hand_off(request: Optional[_ScoreRequest]) -> None:
+        """Queue a request for the workers, raising if they die while the queue is full."""
+        check_workers()
+        if not queue.full():
+            queue.put_nowait(request)
+            return
+        put = asyncio.create_task(queue.put(request))
+        await asyncio.wait([put, *workers], return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            check_workers()
+            raise RuntimeError("AI scorer workers exited before the queue drained")
+
+    next_request = None
+    try:
+        while True:
+            if next_request is None:
+                if retries and retries[0][0] <= time.monotonic():
+                    next_request = heapq.heappop(retries)[2]
+                elif not exhausted:
+                    next_request = next(request_iter, None)
+                    exhausted = next_request is None
+                if next_request is None and exhausted and outstanding == 0 and not retries:
+                    break
+
+            # Refill capacity in proportion to elapsed time
+            now = time.monotonic()
+            elapsed = now - last_update
+            last_update = now
+            available_request_capacity = min(
+                available_request_capacity + max_requests_per_minute * elapsed / 60.0,
+                max_requests_per_minute,
+            )
+            available_token_capacity = min(
+                available_token_capacity + max_tokens_per_minute * elapsed / 60.0,
+                max_tokens_per_minute,
+            )
 
-    if limit:
-        results = results[:limit]
+            if next_request is not None:
+                # A request larger than the whole budget waits for a full bucket
+                token_cost = min(next_request.token_estimate, max_tokens_per_minute)
+                if available_request_capacity >= 1 and available_token_capacity >= token_cost:
+                    available_request_capacity -= 1
+                    available_token_capacity -= token_cost
+                    outstanding += 1
+                    await hand_off(next_request)  # Waits while the workers are saturated
+                    next_request = None
+                    continue
 
-    print(f"Scoring {len(results)} circuits using {model}")
-    print("=" * 60)
+            check_workers()
+            await asyncio.sleep(0.001)
 
-    scored_results = []
+        for _ in workers:
+            await hand_off(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        await session.close()
+
+    return [scores[i] for i in range(len(scores))]
+
+
+BATCH_POLL_INTERVAL = 30.0
+
+_BATCH_TERMINAL_STATES = {'completed', 'failed', 'expired', 'cancelled'}
 
-    for i, result in enumerate(results):
-        prompt = result['prompt']
-        generated_tokn = result['generated_tokn']
 
-        print(f"\n[{i+1}/{len(results)}] {prompt[:60]}...")
+def batch_api_provider(model: str) -> tuple[str, str]:
+    """
+    Split a model string into a Batch API provider and native model name.
+
+    Args:
+        model: Model string such as 'openai/gpt-4o' or 'anthropic/claude-sonnet-4-0'
+
+    Returns:
+        (provider, model_name) where provider is 'openai' or 'anthropic'
+    """
+    provider, _, model_name = model.partition('/')
+    if provider not in ('openai', 'anthropic') or not model_name:
+        raise ValueError(
+            f"--batch-api needs an openai/ or anthropic/ model, got '{model}'"
+        )
+    return provider, model_name
+
+
+def submit_openai_batch(bodies: dict[str, dict],
+                        poll_interval: float = BATCH_POLL_INTERVAL) -> dict[str, str]:
+    """
+    Run chat completion requests as one OpenAI Batch API job and wait for it.
+
+    Args:
+        bodies: Map of custom_id to /v1/chat/completions request body
+        poll_interval: Seconds between status checks
+
+    Returns:
+        Map of custom_id to response text for requests that succeeded (also
+        for expired or cancelled batches; raises RuntimeError if the batch failed)
+    """
+    try:
+        import openai
+    except ImportError:
+        raise ImportError("openai package required. Run: pip install openai")
+
+    api_key = os.environ.get('OPENAI_API_KEY')
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable not set")
+    client = openai.OpenAI(api_key=api_key)
+
+    lines = []
+    for custom_id, body in bodies.items():
+        lines.append(json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        }, ensure_ascii=False))
+    batch_input = ('\n'.join(lines) + '\n').encode('utf-8')
+
+    input_file = client.files.create(file=("batch_input.jsonl", batch_input), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"Submitted OpenAI batch {batch.id} ({len(bodies)} requests)")
+
+    while batch.status not in _BATCH_TERMINAL_STATES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        done = f" {counts.completed + counts.failed}/{counts.total}" if counts else ""
+        print(f"  Batch {batch.id}: {batch.status}{done}")
+
+    if batch.status == 'failed':
+        raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+    if batch.status != 'completed':
+        # Expired and cancelled batches still return the requests that finished;
+        # the rest are simply missing from the result
+        logger.warning(f"OpenAI batch {batch.id} ended with status '{batch.status}', "
+                       f"keeping the requests that completed")
+
+    responses = {}
+    if batch.output_file_id:
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            row = _json_loads(line)
+            response = row.get('response') or {}
+            if response.get('status_code') != 200:
+                continue
+            responses[row['custom_id']] = response['body']['choices'][0]['message']['content'] or ''
+    return responses
+
+
+def submit_anthropic_batch(params: dict[str, dict],
+                           poll_interval: float = BATCH_POLL_INTERVAL) -> dict[str, str]:
+    """
+    Run Messages API requests as one Anthropic Message Batches job and wait for it.
+
+    Args:
+        params: Map of custom_id to messages.create parameters
+        poll_interval: Seconds between status checks
 
+    Returns:
+        Map of custom_id to response text for requests that succeeded
+    """
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError("anthropic package required. Run: pip install anthropic")
+
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+    client = anthropic.Anthropic(api_key=api_key)
+
+    batch = client.messages.batches.create(requests=[
+        {"custom_id": custom_id, "params": request_params}
+        for custom_id, request_params in params.items()
+    ])
+    print(f"Submitted Anthropic batch {batch.id} ({len(params)} requests)")
+
+    while batch.processing_status != 'ended':
+        time.sleep(poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        print(f"  Batch {batch.id}: {batch.processing_status} "
+              f"({counts.processing} processing, {counts.succeeded} succeeded, {counts.errored} errored)")
+
+    responses = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type != 'succeeded':
+            continue
+        responses[entry.custom_id] = ''.join(
+            block.text for block in entry.result.message.content if block.type == 'text'
+        )
+    return responses
+
+
+def _run_openai_batch(requests: dict[str, list[dict]], model_name: str,
+                      poll_interval: float) -> dict[str, str]:
+    """Submit scoring requests (custom_id -> user message parts) as an OpenAI batch."""
+    return submit_openai_batch(
+        {custom_id: _request_body(user_message, model_name) for custom_id, user_message in requests.items()},
+        poll_interval
+    )
+
+
+def _run_anthropic_batch(requests: dict[str, list[dict]], model_name: str,
+                         poll_interval: float) -> dict[str, str]:
+    """Submit scoring requests (custom_id -> user message parts) as an Anthropic batch."""
+    return submit_anthropic_batch({
+        custom_id: {
+            "model": model_name,
+            "max_tokens": 8192,
+            "temperature": 0.1,
+            "system": [{
+                "type": "text",
+                "text": AI_SCORER_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }],
+            "messages": [{"role": "user", "content": user_message}],
+        }
+        for custom_id, user_message in requests.items()
+    }, poll_interval)
+
+
+def _score_results_batch_api(
+    results: list[dict],
+    model: str,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+    cache_dir: Optional[Path] = None
+) -> list[AIScoreResult]:
+    """
+    Score all results with a single provider Batch API job.
+
+    Batch jobs cost roughly half as much as synchronous calls and are not
+    subject to the per-minute rate limits, but can take up to 24 hours.
+
+    Args:
+        results: Benchmark result rows with 'prompt' and 'generated_tokn'
+        model: 'openai/...' or 'anthropic/...' model to call directly
+        poll_interval: Seconds between status checks
+        cache_dir: Directory of cached scores, or None to always call the API
+
+    Returns:
+        AIScoreResult for each row, in input order
+    """
+    provider, model_name = batch_api_provider(model)
+
+    scores: list[Optional[AIScoreResult]] = [None] * len(results)
+    requests = {}
+    for i, result in enumerate(results):
+        generated_tokn = result['generated_tokn']
         if not generated_tokn or not generated_tokn.strip():
-            print("  Skipping: No TOKN generated")
-            ai_score = AIScoreResult(
-                functionality_score=0,
-                completeness_score=0,
-                correctness_score=0,
-                best_practices_score=0,
-                overall_score=0.0,
-                issues=["No TOKN was generated"],
-                suggestions=[],
-                explanation="Circuit generation failed"
-            )
+            scores[i] = _failed_result("No TOKN was generated", "Circuit generation failed")
         else:
-            ai_score = ai_score_circuit(prompt, generated_tokn, model, api_key)
-            print(f"  Overall: {ai_score.overall_score:.1f}/100")
-            print(f"  Func: {ai_score.functionality_score} | "
-                  f"Complete: {ai_score.completeness_score} | "
-                  f"Correct: {ai_score.correctness_score} | "
-                  f"Practice: {ai_score.best_practices_score}")
-            if ai_score.issues:
-                print(f"  Issues: {len(ai_score.issues)}")
-                for issue in ai_score.issues[:2]:  # Show first 2 issues
-                    print(f"    - {issue[:80]}")
-
-        # Combine original result with AI score
-        scored_result = {
-            **result,
-            'ai_score': ai_score.to_dict()
-        }
-        scored_results.append(scored_result)
+            scores[i] = _cache_load(cache_dir, _cache_key(model, result['prompt'], generated_tokn))
+            if scores[i] is None:
+                requests[str(i)] = _build_user_message(result['prompt'], generated_tokn)
+
+    if requests:
+        if provider == 'openai':
+            responses = _run_openai_batch(requests, model_name, poll_interval)
+        else:
+            responses = _run_anthropic_batch(requests, model_name, poll_interval)
+
+        for custom_id in requests:
+            response_text = responses.get(custom_id)
+            if response_text is None:
+                score = _failed_result("Batch request failed", "Batch API returned no result for this circuit")
+            else:
+                try:
+                    score, complete = _parse_score_response(response_text)
+                    if complete:
+                        result = results[int(custom_id)]
+                        _cache_store(cache_dir, _cache_key(model, result['prompt'], result['generated_tokn']), score)
+                except (ValueError, KeyError, TypeError) as e:
+                    score = _failed_result(f"Failed to parse AI response: {e}", response_text[:500])
+            scores[int(custom_id)] = score
+
+    return scores
+
+
+class _LogProgress:
+    """Progress fallback without tqdm: logs a status line every `every` circuits."""
+
+    def __init__(self, total: Optional[int] = None, every: int = 100):
+        self.total = total
+        self.every = every
+        self.count = 0
+
+    def update(self, n: int = 1) -> None:
+        self.count += n
+        if self.count % self.every == 0:
+            self._log()
+
+    def close(self) -> None:
+        if self.count % self.every:
+            self._log()
+
+    def _log(self) -> None:
+        of_total = f"/{self.total}" if self.total else ""
+        logger.info(f"Scored {self.count}{of_total} circuits")
+
+
+def _make_progress(show_progress: bool, total: Optional[int] = None):
+    """Return a tqdm bar when wanted and installed, otherwise a _LogProgress."""
+    if show_progress:
+        try:
+            from tqdm import tqdm
+            return tqdm(total=total, unit="circuit", desc="Scoring")
+        except ImportError:
+            pass
+    return _LogProgress(total)
+
+
+def iter_results(results_jsonl_path: str, limit: Optional[int] = None) -> Iterator[dict]:
+    """
+    Yield benchmark result rows from a JSONL file one at a time.
+
+    Args:
+        results_jsonl_path: Path to benchmark results JSONL file
+        limit: Optional maximum number of rows to yield
+    """
+    with open(results_jsonl_path, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(f):
+            if limit and i >= limit:
+                break
+            yield _json_loads(line)
+
+
+SCORE_BUCKETS = ['90-100', '80-89', '70-79', '60-69', '50-59', '0-49']
+
+
+def summarize_scores(ai_scores: list[AIScoreResult], model: str) -> dict:
+    """
+    Average scores and overall-score distribution over the circuits that scored.
 
-    # Calculate summary statistics
-    valid_scores = [r['ai_score'] for r in scored_results if r['ai_score']['overall_score'] > 0]
+    The scores are packed into one (N, 5) array so the averages and bucket
+    counts run in NumPy; circuits with an overall score of 0 (skipped or
+    failed) are counted in total_scored but excluded from the averages.
 
-    summary = {
+    Args:
+        ai_scores: Scores from a batch run
+        model: Scoring model, recorded in the summary
+
+    Returns:
+        Summary dict as written to the AI scores JSON file
+    """
+    # Columns: overall, functionality, completeness, correctness, best practices
+    scores = np.fromiter(
+        itertools.chain.from_iterable(
+            (s.overall_score, s.functionality_score, s.completeness_score,
+             s.correctness_score, s.best_practices_score)
+            for s in ai_scores
+        ),
+        dtype=np.float64,
+        count=5 * len(ai_scores),
+    ).reshape(-1, 5)
+    valid = scores[scores[:, 0] > 0]
+
+    if len(valid):
+        averages = [float(x) for x in valid.mean(axis=0)]
+        # 90+ -> bucket 0, ..., below 50 -> bucket 5
+        bucket_index = np.clip(9 - (valid[:, 0] // 10).astype(np.int64), 0, 5)
+        buckets = np.bincount(bucket_index, minlength=len(SCORE_BUCKETS)).tolist()
+    else:
+        averages = [0] * 5
+        buckets = [0] * len(SCORE_BUCKETS)
+
+    return {
         'model': model,
-        'total_scored': len(scored_results),
-        'valid_scores': len(valid_scores),
-        'avg_overall_score': sum(s['overall_score'] for s in valid_scores) / len(valid_scores) if valid_scores else 0,
-        'avg_functionality': sum(s['functionality_score'] for s in valid_scores) / len(valid_scores) if valid_scores else 0,
-        'avg_completeness': sum(s['completeness_score'] for s in valid_scores) / len(valid_scores) if valid_scores else 0,
-        'avg_correctness': sum(s['correctness_score'] for s in valid_scores) / len(valid_scores) if valid_scores else 0,
-        'avg_best_practices': sum(s['best_practices_score'] for s in valid_scores) / len(valid_scores) if valid_scores else 0,
-        'score_distribution': {
-            '90-100': len([s for s in valid_scores if s['overall_score'] >= 90]),
-            '80-89': len([s for s in valid_scores if 80 <= s['overall_score'] < 90]),
-            '70-79': len([s for s in valid_scores if 70 <= s['overall_score'] < 80]),
-            '60-69': len([s for s in valid_scores if 60 <= s['overall_score'] < 70]),
-            '50-59': len([s for s in valid_scores if 50 <= s['overall_score'] < 60]),
-            '0-49': len([s for s in valid_scores if s['overall_score'] < 50]),
-        }
+        'total_scored': len(ai_scores),
+        'valid_scores': len(valid),
+        'avg_overall_score': averages[0],
+        'avg_functionality': averages[1],
+        'avg_completeness': averages[2],
+        'avg_correctness': averages[3],
+        'avg_best_practices': averages[4],
+        'score_distribution': dict(zip(SCORE_BUCKETS, buckets)),
     }
 
-    # Save detailed results
+
+def ai_score_batch(
+    results_jsonl_path: str,
+    output_path: str,
+    model: str = "google/gemini-2.5-flash",
+    limit: int = None,
+    api_key: str = None,
+    concurrency: int = 16,
+    max_requests_per_minute: float = 600,
+    max_tokens_per_minute: float = 1_000_000,
+    max_attempts: int = 5,
+    provider_sort: Optional[str] = None,
+    marshal_batch: int = 1,
+    batch_api: bool = False,
+    cache_dir: Optional[Path] = None,
+    show_progress: bool = True
+) -> None:
+    """
+    Score a batch of results from a JSONL file.
+
+    Scored rows are appended to the detailed JSONL as they complete, so an
+    interrupted run keeps the work already done.
+
+    Args:
+        results_jsonl_path: Path to benchmark results JSONL file
+        output_path: Path to save AI scores JSON file
+        model: Model to use for scoring
+        limit: Optional limit on number of results to score
+        api_key: Optional API key (defaults to env var)
+        concurrency: Maximum number of scoring requests in flight at once
+        max_requests_per_minute: Request rate limit to stay under
+        max_tokens_per_minute: Estimated token rate limit to stay under
+        max_attempts: Attempts per request on rate limit or server errors
+        provider_sort: OpenRouter provider ordering (throughput, price or latency),
+            or None (the default) for OpenRouter's default routing
+        marshal_batch: Number of circuits to pack into each scoring request
+        batch_api: Submit everything as one OpenAI/Anthropic Batch API job
+            instead of calling OpenRouter (cheaper, but up to 24h turnaround)
+        cache_dir: Directory of cached scores, or None (the default) to always call
+            the API; the CLI uses DEFAULT_CACHE_DIR
+        show_progress: Show a tqdm progress bar (if installed) instead of
+            logging a status line every 100 circuits
+    """
+    if batch_api:
+        batch_api_provider(model)  # Fail before loading anything on an unsupported model
+
+    results = iter_results(results_jsonl_path, limit)
+    if batch_api:
+        # The whole job is uploaded at once, so the rows are needed up front
+        results = list(results)
+        print(f"Scoring {len(results)} circuits using {model} (Batch API)")
+    else:
+        print(f"Scoring {results_jsonl_path} using {model} (concurrency={concurrency})")
+    print("=" * 60)
+
     detailed_output = output_path.replace('.json', '_detailed.jsonl')
-    with open(detailed_output, 'w', encoding='utf-8') as f:
-        for r in scored_results:
-            f.write(json.dumps(r, ensure_ascii=False) + '\n')
+    progress = _make_progress(show_progress, total=len(results) if batch_api else limit)
+    with open(detailed_output, 'w', encoding='utf-8') as detailed_file:
+        def report(index: int, result: dict, ai_score: AIScoreResult) -> None:
+            detailed_file.write(_json_line({**result, 'ai_score': ai_score.to_dict()}))
+            detailed_file.flush()
+            progress.update(1)
+
+            if not logger.isEnabledFor(logging.DEBUG):
+                return
+            if not result['generated_tokn'] or not result['generated_tokn'].strip():
+                logger.debug(f"[{index+1}] {result['prompt'][:60]}... skipped: no TOKN generated")
+            else:
+                logger.debug(
+                    f"[{index+1}] {result['prompt'][:60]}... "
+                    f"overall {ai_score.overall_score:.1f} | "
+                    f"func {ai_score.functionality_score} | "
+                    f"complete {ai_score.completeness_score} | "
+                    f"correct {ai_score.correctness_score} | "
+                    f"practice {ai_score.best_practices_score} | "
+                    f"{len(ai_score.issues)} issues"
+                )
+
+        if batch_api:
+            ai_scores = _score_results_batch_api(results, model, cache_dir=cache_dir)
+            for i, (result, ai_score) in enumerate(zip(results, ai_scores)):
+                report(i, result, ai_score)
+        else:
+            ai_scores = asyncio.run(_score_results_async(
+                results, model, api_key, concurrency,
+                max_requests_per_minute, max_tokens_per_minute,
+                max_attempts=max_attempts,
+                on_result=report,
+                provider_sort=provider_sort,
+                marshal_batch=marshal_batch,
+                cache_dir=cache_dir,
+            ))
+    progress.close()
+
+    summary = summarize_scores(ai_scores, model)
 
     # Save summary
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -470,6 +1477,8 @@ def ai_score_batch(
     for range_name, count in summary['score_distribution'].items():
         pct = 100 * count / summary['valid_scores'] if summary['valid_scores'] > 0 else 0
         print(f"  {range_name}: {count:3d} ({pct:5.1f}%)")
+    if not batch_api:
+        _print_cache_usage()
     print(f"\nDetailed results: {detailed_output}")
     print(f"Summary saved to: {output_path}")
 
@@ -486,9 +1495,15 @@ Examples:
   # Score first 10 results only
   python benchmark/ai_scorer.py --input benchmark/results_results.jsonl --output benchmark/ai_scores.json --limit 10
 
+  # Score with up to 32 requests in flight
+  python benchmark/ai_scorer.py --input results.jsonl --output scores.json --concurrency 32
+
   # Use a different model
   python benchmark/ai_scorer.py --input results.jsonl --output scores.json --model anthropic/claude-sonnet-4
 
+  # Overnight run through the OpenAI Batch API at half price
+  python benchmark/ai_scorer.py --input results.jsonl --output scores.json --model openai/gpt-4o --batch-api
+
   # Score a single circuit
   python benchmark/ai_scorer.py --prompt "Design a 555 timer LED blinker" --tokn circuit.tokn
         """
@@ -498,6 +1513,19 @@ Examples:
     parser.add_argument('--input', help='Input JSONL file with benchmark results')
     parser.add_argument('--output', help='Output JSON file for AI scores')
     parser.add_argument('--limit', type=int, help='Limit number of results to score')
+    parser.add_argument('--concurrency', '--workers', dest='concurrency', type=int, default=16,
+                       help='Number of scoring workers (max concurrent requests) in batch mode (default: 16)')
+    parser.add_argument('--max-requests-per-minute', type=float, default=600,
+                       help='Request rate limit for batch mode (default: 600)')
+    parser.add_argument('--max-tokens-per-minute', type=float, default=1_000_000,
+                       help='Estimated token rate limit for batch mode (default: 1000000)')
+    parser.add_argument('--max-attempts', type=int, default=5,
+                       help='Attempts per request on rate limit or server errors (default: 5)')
+    parser.add_argument('--marshal-batch', type=int, default=1, metavar='K',
+                       help='Score K circuits per request to stretch the RPM limit (default: 1)')
+    parser.add_argument('--batch-api', action='store_true',
+                       help='Submit one OpenAI/Anthropic Batch API job (~50%% cheaper, up to 24h); '
+                            'needs an openai/ or anthropic/ model and OPENAI_API_KEY or ANTHROPIC_API_KEY')
 
     # Single circuit mode arguments
     parser.add_argument('--prompt', help='Single prompt to evaluate')
@@ -507,19 +1535,44 @@ Examples:
     parser.add_argument('--model', default='google/gemini-2.5-flash',
                        help='Model to use (default: google/gemini-2.5-flash)')
     parser.add_argument('--api-key', help='OpenRouter API key (defaults to OPENROUTER_API_KEY env var)')
+    parser.add_argument('--no-progress', action='store_true',
+                       help='Log a status line every 100 circuits instead of showing a progress bar')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                       help='Log per-circuit scores and retry details')
+    parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+                       help=f'Directory for cached scores (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always call the API instead of reusing cached scores')
+    parser.add_argument('--provider-sort', choices=['throughput', 'price', 'latency'],
+                       help='OpenRouter provider routing (default: throughput for batch, price for single)')
 
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    cache_dir = None if args.no_cache else Path(args.cache_dir)
 
     # Determine mode
     if args.input and args.output:
         # Batch mode
-        ai_score_batch(args.input, args.output, args.model, args.limit, args.api_key)
+        ai_score_batch(args.input, args.output, args.model, args.limit, args.api_key,
+                       concurrency=args.concurrency,
+                       max_requests_per_minute=args.max_requests_per_minute,
+                       max_tokens_per_minute=args.max_tokens_per_minute,
+                       max_attempts=args.max_attempts,
+                       provider_sort=args.provider_sort or 'throughput',
+                       marshal_batch=args.marshal_batch,
+                       batch_api=args.batch_api,
+                       cache_dir=cache_dir,
+                       show_progress=not args.no_progress)
     elif args.prompt and args.tokn:
         # Single circuit mode
         with open(args.tokn, 'r', encoding='utf-8') as f:
             tokn_content = f.read()
 
-        result = ai_score_circuit(args.prompt, tokn_content, args.model, args.api_key)
+        result = ai_score_circuit(args.prompt, tokn_content, args.model, args.api_key,
+                                  provider_sort=args.provider_sort or 'price',
+                                  cache_dir=cache_dir)
 
         print("\n" + "=" * 60)
         print("AI SCORE RESULT")
@@ -540,6 +1593,7 @@ Examples:
             print(f"\nSuggestions ({len(result.suggestions)}):")
             for suggestion in result.suggestions:
                 print(f"  - {suggestion}")
+        _print_cache_usage()
     else:
         parser.print_help()
         print("\nError: Must provide either (--input and --output) or (--prompt and --tokn)")
@@ -9,6 +9,7 @@ These are complex, system-level prompts that test:
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -176,11 +177,50 @@ CHALLENGE_PROMPTS = [
 ]
 
 
+@lru_cache(maxsize=None)
+def challenge_prompts_jsonl() -> bytes:
+    """CHALLENGE_PROMPTS serialised as JSONL, built on first use and reused."""
+    return ''.join(json.dumps(p, ensure_ascii=False) + '\n' for p in CHALLENGE_PROMPTS).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _required_automaton(required: tuple[str, ...]):
+    """Aho-Corasick automaton over the required strings, or None without pyahocorasick."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for s in required:
+        automaton.add_word(s, s)
+    automaton.make_automaton()
+    return automaton
+
+
+def check_required(prompt: dict, tokn: str) -> set[str]:
+    """Return which of a prompt's required_components appear verbatim in the TOKN text.
+
+    Uses one pass over the text with a cached pyahocorasick automaton when the
+    package is installed, otherwise a substring check per component.
+    """
+    required = tuple(prompt['required_components'])
+
+    # An empty component is in every text, but the automaton never reports it
+    # (and can't be built without at least one non-empty word)
+    words = tuple(s for s in required if s)
+    automaton = _required_automaton(words) if words else None
+    if automaton is None:
+        return {s for s in required if s in tokn}
+    found = {s for _, s in automaton.iter(tokn)}
+    if len(words) < len(required):
+        found.add('')
+    return found
+
+
 def export_challenge_prompts(output_path: str):
     """Export challenge prompts to JSONL."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for p in CHALLENGE_PROMPTS:
-            f.write(json.dumps(p, ensure_ascii=False) + '\n')
+    Path(output_path).write_bytes(challenge_prompts_jsonl())
     print(f"Exported {len(CHALLENGE_PROMPTS)} challenge prompts to {output_path}")
 
 
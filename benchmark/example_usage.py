@@ -3,7 +3,58 @@ Example usage of the AI scorer for TOKN circuits.
 Demonstrates both single circuit and batch scoring.
 """
 
-from ai_scorer import ai_score_circuit, AIScoreResult
+from collections import Counter
+from typing import Optional
+
+from ai_scorer import ai_score_circuit, iter_results, AIScoreResult
+
+
+# Issue categories in priority order: an issue counts towards the first one it matches
+ISSUE_CATEGORIES = [
+    ('Decoupling capacitors', ('decoupling',)),
+    ('Power connections', ('power', 'vcc', 'gnd')),
+    ('Resistor values', ('resistor',)),
+    ('Pin connections', ('pin',)),
+]
+
+
+def _build_issue_automaton():
+    """Aho-Corasick automaton mapping each keyword to its category's priority.
+
+    Returns None if pyahocorasick is not installed.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for priority, (_, keywords) in enumerate(ISSUE_CATEGORIES):
+        for keyword in keywords:
+            automaton.add_word(keyword, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_ISSUE_AUTOMATON = _build_issue_automaton()
+
+
+def classify_issue(issue: str) -> Optional[str]:
+    """Return the ISSUE_CATEGORIES name an issue belongs to, or None.
+
+    With pyahocorasick installed, all keywords are found in a single pass over
+    the lowered text; otherwise each category's keywords are checked in turn.
+    """
+    lower = issue.lower()
+    if _ISSUE_AUTOMATON is not None:
+        priority = min((p for _, p in _ISSUE_AUTOMATON.iter(lower)), default=None)
+        return None if priority is None else ISSUE_CATEGORIES[priority][0]
+
+    for category, keywords in ISSUE_CATEGORIES:
+        if any(keyword in lower for keyword in keywords):
+            return category
+    return None
+
 
 # Example 1: Score a single circuit programmatically
 def example_single_score():
@@ -109,7 +160,6 @@ def print_score_result(result: AIScoreResult):
 # Example 2: Analyze score distribution
 def example_score_analysis():
     """Analyze AI scores from a batch run."""
-    import json
     from pathlib import Path
 
     # This assumes you've already run batch scoring
@@ -124,23 +174,44 @@ def example_score_analysis():
     print("\nAnalyzing AI scores...")
     print("=" * 60)
 
-    with open(scores_file) as f:
-        results = [json.loads(line) for line in f]
+    # Single streaming pass: running sums for the averages, running best/worst,
+    # and issue counts, so only two records are ever kept in memory
+    keys = ('overall_score', 'functionality_score', 'completeness_score',
+            'correctness_score', 'best_practices_score')
+    sums = [0.0] * len(keys)
+    n_scored = 0
+    best = worst = None
+    total_issues = 0
+    issue_keywords = Counter()
+
+    for r in iter_results(str(scores_file)):
+        score = r['ai_score']
+        overall = score['overall_score']
+        if overall > 0:
+            n_scored += 1
+            for i, k in enumerate(keys):
+                sums[i] += score[k]
+        if best is None or overall > best['ai_score']['overall_score']:
+            best = r
+        if worst is None or overall < worst['ai_score']['overall_score']:
+            worst = r
+
+        total_issues += len(score['issues'])
+        issue_keywords.update(filter(None, map(classify_issue, score['issues'])))
+
+    if best is None:
+        print("No results to analyze.")
+        return
 
-    # Calculate statistics
-    scores = [r['ai_score'] for r in results if r['ai_score']['overall_score'] > 0]
+    means = [total / n_scored if n_scored else float('nan') for total in sums]
 
-    print(f"Total circuits scored: {len(scores)}")
+    print(f"Total circuits scored: {n_scored}")
     print(f"\nAverage Scores:")
-    print(f"  Overall:        {sum(s['overall_score'] for s in scores) / len(scores):.1f}/100")
-    print(f"  Functionality:  {sum(s['functionality_score'] for s in scores) / len(scores):.1f}/100")
-    print(f"  Completeness:   {sum(s['completeness_score'] for s in scores) / len(scores):.1f}/100")
-    print(f"  Correctness:    {sum(s['correctness_score'] for s in scores) / len(scores):.1f}/100")
-    print(f"  Best Practices: {sum(s['best_practices_score'] for s in scores) / len(scores):.1f}/100")
-
-    # Find best and worst
-    best = max(results, key=lambda r: r['ai_score']['overall_score'])
-    worst = min(results, key=lambda r: r['ai_score']['overall_score'])
+    print(f"  Overall:        {means[0]:.1f}/100")
+    print(f"  Functionality:  {means[1]:.1f}/100")
+    print(f"  Completeness:   {means[2]:.1f}/100")
+    print(f"  Correctness:    {means[3]:.1f}/100")
+    print(f"  Best Practices: {means[4]:.1f}/100")
 
     print(f"\nBest Circuit ({best['ai_score']['overall_score']:.1f}/100):")
     print(f"  Prompt: {best['prompt'][:60]}...")
@@ -151,24 +222,9 @@ def example_score_analysis():
     print(f"  {worst['ai_score']['explanation'][:100]}...")
 
     # Common issues
-    all_issues = []
-    for r in results:
-        all_issues.extend(r['ai_score']['issues'])
-
-    print(f"\nTotal issues found: {len(all_issues)}")
+    print(f"\nTotal issues found: {total_issues}")
     print(f"Most common issue types:")
-    issue_keywords = {}
-    for issue in all_issues:
-        if 'decoupling' in issue.lower():
-            issue_keywords['Decoupling capacitors'] = issue_keywords.get('Decoupling capacitors', 0) + 1
-        elif 'power' in issue.lower() or 'vcc' in issue.lower() or 'gnd' in issue.lower():
-            issue_keywords['Power connections'] = issue_keywords.get('Power connections', 0) + 1
-        elif 'resistor' in issue.lower():
-            issue_keywords['Resistor values'] = issue_keywords.get('Resistor values', 0) + 1
-        elif 'pin' in issue.lower():
-            issue_keywords['Pin connections'] = issue_keywords.get('Pin connections', 0) + 1
-
-    for keyword, count in sorted(issue_keywords.items(), key=lambda x: -x[1])[:5]:
+    for keyword, count in issue_keywords.most_common(5):
         print(f"  {keyword}: {count}")
 
 
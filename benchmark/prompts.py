@@ -5,17 +5,43 @@ Generates specific, testable prompts from the training data.
 Prompts include concrete component requirements that can be verified.
 """
 
+import atexit
+import contextlib
+import functools
+import itertools
 import json
 import random
 import re
 import sqlite3
+import sys
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field
+from typing import Iterator, Optional
 
+import numpy as np
 
-@dataclass
+try:
+    import orjson  # Optional: faster JSON decode/encode for large databases
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+# json.dumps() with non-default options builds a new encoder per call; reuse one
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# IC part numbers in parentheses after U/IC references. The lookahead only accepts
+# text that looks like a part number (letters and digits, not just words).
+_IC_RE = re.compile(r'[UI]C?\d+\s*\(((?=[^)]*?(?:[A-Za-z][^)]*\d|\d[^)]*[A-Za-z]))[^)]+)\)')
+# Values in parentheses after R/C/L/F references
+_VALUE_RE = re.compile(r'[RCLF]\d+\s*\(([^)]+)\)')
+# Component value shape: number + unit, e.g. 10k, 0.1uF, 4.7nF, 100R, 2.2uH
+_VALUE_SHAPE_RE = re.compile(r'^[\d.]+\s*[kKmMuUnNpPrRfFhH]')
+
+
+@dataclass(slots=True, frozen=True)
 class BenchmarkPrompt:
-    """A benchmark prompt with expected reference output."""
+    """A benchmark prompt with expected reference output (immutable, no per-instance __dict__)."""
     prompt: str
     prompt_style: str
     reference_tokn: str
@@ -34,34 +60,44 @@ class BenchmarkPrompt:
     score: float = 0.0
 
 
-def parse_components(components_str: str) -> tuple[list[str], list[str]]:
+@functools.lru_cache(maxsize=4096)
+def parse_components(components_str: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
     """Parse component string to extract ICs and values.
 
+    Memoized: shared building-block subcircuits repeat the same string, and the
+    tuples returned are immutable so cached results can't be altered by callers.
+
     Input: "U7 (EMC2101), R9 (10k), C33 (0.1uF), C29 (0.1uF)"
-    Output: (["EMC2101"], ["EMC2101", "10k", "0.1uF"])
+    Output: (("EMC2101",), ("EMC2101", "10k", "0.1uF"))
     """
     ics = []
     all_parts = []
 
-    # Find IC part numbers in parentheses after U/IC references
-    ic_pattern = r'[UI]C?\d+\s*\(([^)]+)\)'
-    for match in re.finditer(ic_pattern, components_str):
+    # Find IC part numbers (the pattern only matches part-number-like text)
+    for match in _IC_RE.finditer(components_str):
         part = match.group(1).strip()
-        # Must look like a part number (has letters and numbers, not just text)
-        if part and re.search(r'[A-Z].*\d|\d.*[A-Z]', part, re.I):
-            ics.append(part)
-            all_parts.append(part)
+        ics.append(part)
+        all_parts.append(part)
 
     # Find values in parentheses (resistors, caps, inductors)
-    # Must be actual values like 10k, 0.1uF, 4.7nF, 100R, 2.2uH
-    value_pattern = r'[RCLF]\d+\s*\(([^)]+)\)'
-    for match in re.finditer(value_pattern, components_str):
+    for match in _VALUE_RE.finditer(components_str):
         value = match.group(1).strip()
         # Must look like a component value (number + unit)
-        if value and re.match(r'^[\d.]+\s*[kKmMuUnNpPrRfFhH]', value):
+        if value and _VALUE_SHAPE_RE.match(value):
             all_parts.append(value)
 
-    return ics, all_parts
+    # Deduplicate, keeping first-seen order
+    return tuple(dict.fromkeys(ics)), tuple(dict.fromkeys(all_parts))
+
+
+PROMPT_STYLES = tuple(map(sys.intern, ('detailed', 'component_list', 'functional')))
+
+
+def _style_stream(rng: np.random.Generator, block: int = 1024) -> Iterator[str]:
+    """Yield prompt styles drawn from rng, one vectorized block of draws at a time."""
+    while True:
+        for code in rng.integers(0, len(PROMPT_STYLES), size=block).tolist():
+            yield PROMPT_STYLES[code]
 
 
 def generate_specific_prompt(subcircuit: dict) -> tuple[str, str, list[str], list[str]]:
@@ -69,15 +105,27 @@ def generate_specific_prompt(subcircuit: dict) -> tuple[str, str, list[str], lis
 
     Returns: (prompt_text, style, required_ics, required_components)
     """
+    ics, all_parts = parse_components(subcircuit.get('components', ''))
+    style = random.choice(PROMPT_STYLES)
+    return render_prompt(subcircuit, style, ics, all_parts), style, list(ics), list(all_parts)
+
+
+def render_prompt(subcircuit: dict, style: str, ics: tuple[str, ...], all_parts: tuple[str, ...]) -> str:
+    """Build the prompt text for a subcircuit in the given style.
+
+    Args:
+        subcircuit: Subcircuit dict from classification data
+        style: One of PROMPT_STYLES
+        ics: Required ICs, from parse_components()
+        all_parts: All required parts, from parse_components()
+
+    Returns:
+        Prompt text mentioning the key components
+    """
     name = subcircuit.get('name', '')
     description = subcircuit.get('description', '')
-    components = subcircuit.get('components', '')
     use_case = subcircuit.get('useCase', '')
-
-    ics, all_parts = parse_components(components)
-
-    # Build a specific prompt that mentions the key components
-    style = random.choice(['detailed', 'component_list', 'functional'])
+    ics_set = set(ics)
 
     if style == 'detailed' and description:
         # Use description but add component requirements
@@ -86,7 +134,7 @@ def generate_specific_prompt(subcircuit: dict) -> tuple[str, str, list[str], lis
             prompt += f" Use {', '.join(ics[:3])}."
         if len(all_parts) > len(ics):
             # Add some passive values
-            passives = [p for p in all_parts if p not in ics][:3]
+            passives = [p for p in all_parts if p not in ics_set][:3]
             if passives:
                 prompt += f" Include {', '.join(passives)} components."
 
@@ -98,7 +146,7 @@ def generate_specific_prompt(subcircuit: dict) -> tuple[str, str, list[str], lis
             prompt = f"Design a {name} circuit"
 
         # Add passive requirements
-        passives = [p for p in all_parts if p not in ics][:4]
+        passives = [p for p in all_parts if p not in ics_set][:4]
         if passives:
             prompt += f" with {', '.join(passives)}"
         prompt += "."
@@ -115,107 +163,183 @@ def generate_specific_prompt(subcircuit: dict) -> tuple[str, str, list[str], lis
         if len(all_parts) > 1:
             prompt += f" Include appropriate decoupling."
 
-    return prompt, style, ics, all_parts
+    return prompt
+
+
+def _intern(value):
+    """sys.intern() strings (repo names, file names and tags repeat across prompts)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Shared connections, keyed by resolved database path, each with a lock that
+# callers hold while using it (the connection is shared across threads).
+# Repeated loads skip the connect/schema-parse cost and reuse sqlite3's
+# per-connection statement cache.
+_CONNECTIONS: dict[str, tuple[sqlite3.Connection, threading.Lock]] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _get_connection(db_path: str) -> tuple[sqlite3.Connection, threading.Lock]:
+    """Return the shared connection for db_path and its lock, opening it on first use."""
+    key = str(Path(db_path).resolve())
+    with _CONNECTIONS_LOCK:
+        entry = _CONNECTIONS.get(key)
+        if entry is None:
+            conn = sqlite3.connect(key, check_same_thread=False)
+            # Read-mostly workload: map the file and give the page cache 64 MiB
+            conn.execute('PRAGMA mmap_size=268435456')
+            conn.execute('PRAGMA cache_size=-65536')
+            if not _CONNECTIONS:
+                atexit.register(_close_connections)
+            entry = _CONNECTIONS[key] = (conn, threading.Lock())
+    return entry
+
+
+def _close_connections() -> None:
+    """Close the shared connections at interpreter exit."""
+    for conn, _ in _CONNECTIONS.values():
+        conn.close()
+    _CONNECTIONS.clear()
 
 
 def load_benchmark_prompts(
     db_path: str,
     min_score: float = 5.0,
     limit: int = 100,
-    seed: int = 42
+    seed: int = 42,
+    max_files: Optional[int] = None
 ) -> list[BenchmarkPrompt]:
-    """Load benchmark prompts from the database."""
+    """Load benchmark prompts from the database.
+
+    Args:
+        db_path: Path to the kicad_repos SQLite database
+        min_score: Minimum file classification score
+        limit: Number of prompts to return
+        seed: Random seed for prompt styles and sampling
+        max_files: Only consider the top-scoring max_files files (default: all).
+            Faster on large databases, but narrows the pool the sample is drawn from.
+    """
     random.seed(seed)
-
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Get high-quality files with TOKN
-    cursor.execute('''
-        SELECT f.id, f.file_name, f.tokn, f.classification_data, f.classification_score,
-               r.full_name
-        FROM files f
-        JOIN repositories r ON f.repo_id = r.id
-        WHERE f.tokn IS NOT NULL
-          AND f.classification_score >= ?
-        ORDER BY f.classification_score DESC
-    ''', (min_score,))
-
-    rows = cursor.fetchall()
-    conn.close()
-
-    # Build prompts from subcircuits
-    all_prompts = []
-
-    for row in rows:
-        file_id, file_name, tokn, classification_json, score, repo = row
-
-        try:
-            classification = json.loads(classification_json)
-            subcircuits = classification.get('subcircuits', [])
-        except:
-            continue
-
-        for sc in subcircuits:
-            # Skip subcircuits without specific components
-            components = sc.get('components', '')
-            if not components or len(components) < 10:
-                continue
-
-            # Generate specific prompt with requirements
-            prompt_text, style, req_ics, req_components = generate_specific_prompt(sc)
-
-            # REQUIRE at least one IC - this is what makes the benchmark meaningful
-            # Without a specific IC requirement, the model can generate any valid circuit
-            if not req_ics:
-                continue
-
-            # Also require at least 2 total components to test
-            if len(req_components) < 2:
+    styles = _style_stream(np.random.default_rng(seed))
+
+    # Hold the connection's lock for the whole query: rows are streamed from
+    # the cursor, and the connection is shared with other threads
+    conn, conn_lock = _get_connection(db_path)
+    with conn_lock, contextlib.closing(conn.cursor()) as cursor:
+        cursor.row_factory = sqlite3.Row
+        cursor.arraysize = 1000
+
+        # Get high-quality files with TOKN. Files whose classification has no
+        # subcircuits (or isn't valid JSON) are dropped in SQLite rather than
+        # decoded in Python. LIMIT -1 means no limit.
+        cursor.execute('''
+            SELECT f.id, f.file_name, f.tokn, f.classification_data, f.classification_score,
+                   r.full_name
+            FROM files f
+            JOIN repositories r ON f.repo_id = r.id
+            WHERE f.tokn IS NOT NULL
+              AND f.classification_score >= ?
+              AND json_valid(f.classification_data)
+              AND json_array_length(f.classification_data, '$.subcircuits') > 0
+            ORDER BY f.classification_score DESC
+            LIMIT ?
+        ''', (min_score, max_files or -1))
+
+        # Reservoir-sample candidate subcircuits while streaming rows from the
+        # cursor in fetchmany() batches, so memory stays at `limit` candidates however large the DB is.
+        # Prompt text and BenchmarkPrompt objects are built for the survivors only.
+        reservoir = []
+        seen = 0
+
+        rows = itertools.chain.from_iterable(iter(cursor.fetchmany, []))
+        for row in rows:
+            try:
+                classification = _json_loads(row['classification_data'])
+                subcircuits = classification.get('subcircuits', [])
+            except:
                 continue
 
-            benchmark = BenchmarkPrompt(
-                prompt=prompt_text,
-                prompt_style=style,
-                reference_tokn=tokn,
-                required_components=req_components,
-                required_ics=req_ics,
-                subcircuit_name=sc.get('name', ''),
-                subcircuit_tags=sc.get('tags', []),
-                subcircuit_components=components,
-                file_id=file_id,
-                file_name=file_name,
-                repo=repo,
-                score=score,
-            )
-            all_prompts.append(benchmark)
-
-    # Shuffle and limit
-    random.shuffle(all_prompts)
-    return all_prompts[:limit]
+            for sc in subcircuits:
+                # Skip subcircuits without specific components
+                components = sc.get('components', '')
+                if not components or len(components) < 10:
+                    continue
+
+                # Requirements and style
+                req_ics, req_components = parse_components(components)
+                style = next(styles)
+
+                # REQUIRE at least one IC - this is what makes the benchmark meaningful
+                # Without a specific IC requirement, the model can generate any valid circuit
+                if not req_ics:
+                    continue
+
+                # Also require at least 2 total components to test
+                if len(req_components) < 2:
+                    continue
+
+                candidate = (sc, style, req_ics, req_components, row)
+                if len(reservoir) < limit:
+                    reservoir.append(candidate)
+                else:
+                    j = random.randrange(seen + 1)
+                    if j < limit:
+                        reservoir[j] = candidate
+                seen += 1
+
+    # Reservoir slots are biased towards arrival order; shuffle the sample
+    random.shuffle(reservoir)
+
+    return [
+        BenchmarkPrompt(
+            prompt=render_prompt(sc, style, req_ics, req_components),
+            prompt_style=style,
+            reference_tokn=row['tokn'],
+            required_components=list(req_components),
+            required_ics=list(req_ics),
+            subcircuit_name=sc.get('name', ''),
+            subcircuit_tags=[_intern(tag) for tag in sc.get('tags', [])],
+            subcircuit_components=sc['components'],
+            file_id=row['id'],
+            file_name=_intern(row['file_name']),
+            repo=_intern(row['full_name']),
+            score=row['classification_score'],
+        )
+        for sc, style, req_ics, req_components, row in reservoir
+    ]
 
 
 def export_prompts_jsonl(prompts: list[BenchmarkPrompt], output_path: str):
-    """Export prompts to JSONL for benchmarking."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for p in prompts:
-            obj = {
-                'prompt': p.prompt,
-                'prompt_style': p.prompt_style,
-                'reference_tokn': p.reference_tokn,
-                'required_components': p.required_components,
-                'required_ics': p.required_ics,
-                'metadata': {
-                    'subcircuit_name': p.subcircuit_name,
-                    'subcircuit_tags': p.subcircuit_tags,
-                    'subcircuit_components': p.subcircuit_components,
-                    'file_id': p.file_id,
-                    'file_name': p.file_name,
-                    'repo': p.repo,
-                    'score': p.score,
-                }
+    """Export prompts to JSONL for benchmarking.
+
+    Lines are accumulated in one buffer and written with a single call.
+    """
+    buf = bytearray()
+    for p in prompts:
+        obj = {
+            'prompt': p.prompt,
+            'prompt_style': p.prompt_style,
+            'reference_tokn': p.reference_tokn,
+            'required_components': p.required_components,
+            'required_ics': p.required_ics,
+            'metadata': {
+                'subcircuit_name': p.subcircuit_name,
+                'subcircuit_tags': p.subcircuit_tags,
+                'subcircuit_components': p.subcircuit_components,
+                'file_id': p.file_id,
+                'file_name': p.file_name,
+                'repo': p.repo,
+                'score': p.score,
             }
-            f.write(json.dumps(obj, ensure_ascii=False) + '\n')
+        }
+        if orjson is not None:
+            buf += orjson.dumps(obj)
+        else:
+            buf += _JSON_ENCODER.encode(obj).encode('utf-8')
+        buf += b'\n'
+
+    with open(output_path, 'wb') as f:
+        f.write(buf)
 
     print(f"Exported {len(prompts)} prompts to {output_path}")
 
@@ -250,6 +374,8 @@ def main():
         print(f"    Required ICs: {p.required_ics}")
         print(f"    Required components: {p.required_components[:5]}...")
 
+    print(f"\nparse_components cache: {parse_components.cache_info()}")
+
     export_prompts_jsonl(prompts, str(output_path))
 
 
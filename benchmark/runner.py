@@ -5,15 +5,18 @@ Runs prompts through a model, validates outputs, and runs AI scoring.
 Outputs structured results to timestamped directories.
 """
 
+import asyncio
+import itertools
 import json
 import time
 import os
 from pathlib import Path
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 import sys
 import re
+from collections import defaultdict
 
 # Load environment variables from .env.local
 from dotenv import load_dotenv
@@ -103,6 +106,62 @@ class BenchmarkSummary:
         return asdict(self)
 
 
+# BenchmarkSummary average -> PromptResult field it averages
+_AVERAGED_FIELDS = {
+    'avg_static_score': 'static_score',
+    'avg_requirement_score': 'requirement_score',
+    'avg_ai_functionality': 'ai_functionality_score',
+    'avg_ai_completeness': 'ai_completeness_score',
+    'avg_ai_correctness': 'ai_correctness_score',
+    'avg_ai_best_practices': 'ai_best_practices_score',
+    'avg_ai_overall': 'ai_overall_score',
+    'avg_generation_time_ms': 'generation_time_ms',
+}
+
+# Difficulties reported in BenchmarkSummary.scores_by_difficulty, in order
+SUMMARY_DIFFICULTIES = ('easy', 'medium', 'hard')
+
+
+@dataclass
+class SummaryTotals:
+    """Running totals for a BenchmarkSummary, updated one result at a time."""
+    count: int = 0
+    syntax_valid_count: int = 0
+    semantic_valid_count: int = 0
+    sums: dict = field(default_factory=lambda: dict.fromkeys(_AVERAGED_FIELDS.values(), 0))
+    # difficulty -> [count, static score sum, AI overall score sum]
+    by_difficulty: dict = field(default_factory=lambda: defaultdict(lambda: [0, 0, 0]))
+
+    def add(self, result: PromptResult) -> None:
+        """Add one result to the totals."""
+        self.count += 1
+        self.syntax_valid_count += result.syntax_valid
+        self.semantic_valid_count += result.semantic_valid
+        sums = self.sums
+        for name in sums:
+            sums[name] += getattr(result, name)
+        difficulty = self.by_difficulty[result.prompt_style]
+        difficulty[0] += 1
+        difficulty[1] += result.static_score
+        difficulty[2] += result.ai_overall_score
+
+    def fill(self, summary: BenchmarkSummary) -> None:
+        """Set the summary's counts and averages from the totals."""
+        summary.total_prompts = self.count
+        summary.syntax_valid_count = self.syntax_valid_count
+        summary.semantic_valid_count = self.semantic_valid_count
+        for average, name in _AVERAGED_FIELDS.items():
+            setattr(summary, average, self.sums[name] / self.count if self.count else 0)
+        for diff in SUMMARY_DIFFICULTIES:
+            if diff in self.by_difficulty:
+                count, static_sum, ai_sum = self.by_difficulty[diff]
+                summary.scores_by_difficulty[diff] = {
+                    'count': count,
+                    'avg_static_score': static_sum / count,
+                    'avg_ai_overall': ai_sum / count,
+                }
+
+
 # System prompt for TOKN generation
 SYSTEM_PROMPT = """You are an expert electronics design assistant that generates TOKN format schematics.
 
@@ -229,28 +288,35 @@ wires[45]{net,pts}:
 Generate complete, valid TOKN schematics with all sections populated."""
 
 
+# ```tokn, ```toon or bare ``` code block in a model response
+_TOKN_BLOCK_RE = re.compile(r'```(?:tokn|toon)?\s*\n(.*?)```', re.DOTALL)
+
+# Lines that end unfenced TOKN, in priority order (the first marker found wins,
+# not the earliest position)
+_TOKN_END_MARKERS = ('\n## ', '\n# ', '\n---', '\nThis ', '\nThe ', '\nNote:')
+
+
 def extract_tokn(text: str) -> str:
     """Extract TOKN content from a model response."""
     if not text:
         return ""
 
     # Try to find ```tokn or ```toon or ``` block containing # TOKN v1
-    code_block_match = re.search(r'```(?:tokn|toon)?\s*\n(.*?)```', text, re.DOTALL)
+    code_block_match = _TOKN_BLOCK_RE.search(text)
     if code_block_match:
         content = code_block_match.group(1).strip()
         if '# TOKN v1' in content:
             return content
 
     # Try to find # TOKN v1 directly
-    if '# TOKN v1' in text:
-        start = text.find('# TOKN v1')
+    start = text.find('# TOKN v1')
+    if start != -1:
         content = text[start:]
 
-        # Find where TOKN ends
-        end_markers = ['\n## ', '\n# ', '\n---', '\nThis ', '\nThe ', '\nNote:']
-        for marker in end_markers:
-            if marker in content[10:]:
-                end = content.find(marker, 10)
+        # Find where TOKN ends (markers are searched after the header)
+        for marker in _TOKN_END_MARKERS:
+            end = content.find(marker, 10)
+            if end != -1:
                 content = content[:end]
                 break
 
@@ -291,15 +357,35 @@ def get_provider_config(model: str) -> tuple[str, str, str, dict]:
     )
 
 
+def _import_openai():
+    try:
+        import openai
+    except ImportError:
+        raise ImportError("openai package not installed. Run: pip install openai")
+    return openai
+
+
+def _generation_kwargs(prompt: str, actual_model: str, extra_headers: dict) -> dict:
+    """chat.completions.create arguments for one generation request."""
+    kwargs = {
+        "model": actual_model,
+        "max_tokens": 16384,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+    }
+    if extra_headers:
+        kwargs["extra_headers"] = extra_headers
+    return kwargs
+
+
 def generate_tokn(prompt: str, model: str) -> tuple[str, float]:
     """Generate TOKN using the appropriate API provider.
 
     Returns: (generated_text, generation_time_ms)
     """
-    try:
-        import openai
-    except ImportError:
-        raise ImportError("openai package not installed. Run: pip install openai")
+    openai = _import_openai()
 
     base_url, api_key, actual_model, extra_headers = get_provider_config(model)
 
@@ -311,18 +397,7 @@ def generate_tokn(prompt: str, model: str) -> tuple[str, float]:
     start_time = time.time()
 
     try:
-        kwargs = {
-            "model": actual_model,
-            "max_tokens": 16384,
-            "messages": [
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-        }
-        if extra_headers:
-            kwargs["extra_headers"] = extra_headers
-
-        response = client.chat.completions.create(**kwargs)
+        response = client.chat.completions.create(**_generation_kwargs(prompt, actual_model, extra_headers))
         generated = response.choices[0].message.content
     except Exception as e:
         print(f"  Error: {e}")
@@ -332,6 +407,160 @@ def generate_tokn(prompt: str, model: str) -> tuple[str, float]:
     return generated, generation_time
 
 
+async def _generate_tokn_async(
+    client,
+    index: int,
+    prompt: str,
+    actual_model: str,
+    extra_headers: dict
+) -> tuple[str, float]:
+    """Async generate_tokn on a shared openai.AsyncOpenAI client. Errors give "".
+
+    index is the prompt's 0-based position, used to attribute error messages
+    (requests finish out of order, before their prompt's progress line).
+    """
+    start_time = time.time()
+
+    try:
+        response = await client.chat.completions.create(**_generation_kwargs(prompt, actual_model, extra_headers))
+        generated = response.choices[0].message.content
+    except Exception as e:
+        print(f"  Error on prompt {index + 1}: {e}")
+        generated = ""
+
+    generation_time = (time.time() - start_time) * 1000
+    return generated, generation_time
+
+
+async def generate_tokn_stream(
+    prompts: Iterable[str],
+    model: str,
+    on_result: Callable[[int, str, float], None],
+    concurrency: int = 16,
+    max_attempts: int = 5
+) -> None:
+    """Generate TOKN for many prompts concurrently, handing each result on as it finishes.
+
+    Prompts are read lazily and handed to a fixed pool of concurrency workers
+    through a bounded queue, so the first request goes out as soon as the
+    first prompt is available. The workers share one AsyncOpenAI client. Rate
+    limit (429) and server errors are retried by the client with exponential
+    backoff, honouring Retry-After, up to max_attempts per request.
+
+    on_result(index, generated_text, generation_time_ms) is called once per
+    prompt in completion order, one call at a time in a worker thread, so
+    slow processing (validation, AI scoring, file writes) does not stall the
+    requests still in flight. Finished generations wait in a bounded queue,
+    so only O(concurrency) prompts and responses are held at once. If
+    on_result raises, generation stops and the exception propagates.
+    """
+    openai = _import_openai()
+
+    base_url, api_key, actual_model, extra_headers = get_provider_config(model)
+
+    client = openai.AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        max_retries=max(0, max_attempts - 1),
+    )
+
+    worker_count = max(1, concurrency)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2 * worker_count)
+    finished: asyncio.Queue = asyncio.Queue(maxsize=2 * worker_count)
+
+    async def worker() -> None:
+        while True:
+            job = await queue.get()
+            if job is None:
+                return
+            index, prompt = job
+            generated, generation_time = await _generate_tokn_async(
+                client, index, prompt, actual_model, extra_headers
+            )
+            await finished.put((index, generated, generation_time))  # Waits while on_result is behind
+
+    async def produce() -> None:
+        for job in enumerate(prompts):
+            await queue.put(job)  # Waits while the workers are saturated
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+        await finished.put(None)
+
+    async def consume() -> None:
+        while True:
+            item = await finished.get()
+            if item is None:
+                return
+            await asyncio.to_thread(on_result, *item)
+
+    workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+    tasks = [asyncio.create_task(produce()), asyncio.create_task(consume())]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in workers + tasks:
+            task.cancel()
+        await client.close()
+
+
+async def generate_tokn_batch(
+    prompts: Iterable[str],
+    model: str,
+    concurrency: int = 16,
+    max_attempts: int = 5
+) -> list[tuple[str, float]]:
+    """Generate TOKN for many prompts concurrently (see generate_tokn_stream).
+
+    Returns: (generated_text, generation_time_ms) per prompt, in input order
+    """
+    generations: dict[int, tuple[str, float]] = {}
+
+    def collect(index: int, generated: str, generation_time: float) -> None:
+        generations[index] = (generated, generation_time)
+
+    await generate_tokn_stream(prompts, model, collect, concurrency=concurrency, max_attempts=max_attempts)
+    return [generations[i] for i in range(len(generations))]
+
+
+def generate_tokn_batch_api(prompts: list[str], model: str) -> list[tuple[str, float]]:
+    """Generate TOKN for all prompts as one OpenAI or Anthropic Batch API job.
+
+    Batch jobs cost roughly half as much as synchronous calls and are not
+    subject to the per-minute rate limits, but can take up to 24 hours. The
+    model is called directly ('openai/...' or 'anthropic/...'), not through
+    OpenRouter. Per-request latency is not reported by the batch APIs, so
+    generation_time_ms is 0.
+
+    Returns: (generated_text, generation_time_ms) per prompt, in input order
+    """
+    from ai_scorer import batch_api_provider, submit_anthropic_batch, submit_openai_batch
+
+    provider, model_name = batch_api_provider(model)
+    if provider == 'openai':
+        responses = submit_openai_batch({
+            str(i): _generation_kwargs(prompt, model_name, {})
+            for i, prompt in enumerate(prompts)
+        })
+    else:
+        responses = submit_anthropic_batch({
+            str(i): {
+                "model": model_name,
+                "max_tokens": 16384,
+                "system": [{
+                    "type": "text",
+                    "text": SYSTEM_PROMPT,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+                "messages": [{"role": "user", "content": prompt}],
+            }
+            for i, prompt in enumerate(prompts)
+        })
+
+    # Failed requests are missing from responses and count as empty generations
+    return [(responses.get(str(i), ""), 0.0) for i in range(len(prompts))]
+
+
 def run_ai_scoring(prompt: str, tokn: str, model: str = "google/gemini-2.5-flash") -> dict:
     """Run AI scoring on a generated TOKN circuit."""
     try:
@@ -352,6 +581,21 @@ def run_ai_scoring(prompt: str, tokn: str, model: str = "google/gemini-2.5-flash
         }
 
 
+def iter_prompts_file(path) -> Iterator[dict]:
+    """Yield the prompts in a JSONL file one at a time, skipping blank lines.
+
+    Prompts without a 'difficulty' get their 'prompt_style' (or 'unknown').
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            p = json.loads(line)
+            if 'difficulty' not in p:
+                p['difficulty'] = p.get('prompt_style', 'unknown')
+            yield p
+
+
 def load_prompts(easy: int, medium: int, hard: int) -> list[dict]:
     """Load prompts from difficulty-tier files."""
     import random
@@ -406,175 +650,198 @@ def run_benchmark(
     model: str = "google/gemini-2.5-flash",
     run_ai_scores: bool = True,
     prompts_file: str = None,
+    concurrency: int = 16,
+    max_attempts: int = 5,
+    batch_api: bool = False,
 ) -> str:
     """Run the full benchmark pipeline.
 
     Returns: Path to output directory
     """
-    # Create output directory
-    timestamp = datetime.now().strftime("%y%m%d_%H%M%S")
-    output_dir = Path(__file__).parent / "output" / f"{timestamp}_results"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if batch_api:
+        from ai_scorer import batch_api_provider
+        batch_api_provider(model)  # Fail before creating any output on an unsupported model
 
     # Load prompts
+    # A --prompts file is read lazily as generation consumes it, so its size
+    # and per-difficulty counts are only known once the run ends. The tier
+    # files are sampled, which needs them in memory.
     if prompts_file:
-        with open(prompts_file, 'r', encoding='utf-8') as f:
-            prompts = [json.loads(line) for line in f]
-            for p in prompts:
-                if 'difficulty' not in p:
-                    p['difficulty'] = p.get('prompt_style', 'unknown')
+        prompts = iter_prompts_file(prompts_file)
+        first_prompt = next(prompts, None)  # Fail before creating any output on an empty file
+        if first_prompt is None:
+            raise ValueError(f"No prompts loaded from {prompts_file}")
+        prompts = itertools.chain([first_prompt], prompts)
+        prompt_count = None
     else:
         prompts = load_prompts(easy, medium, hard)
+        prompt_count = len(prompts)
+        if not prompts:
+            raise ValueError("No prompts loaded. Use -e, -m, -H flags or --prompts")
 
-    if not prompts:
-        raise ValueError("No prompts loaded. Use -e, -m, -H flags or --prompts")
-
-    # Count by difficulty
-    diff_counts = {'easy': 0, 'medium': 0, 'hard': 0}
-    for p in prompts:
-        diff = p.get('difficulty', 'unknown')
-        if diff in diff_counts:
-            diff_counts[diff] += 1
+    # Create output directory
+    timestamp = datetime.now().strftime("%y%m%d_%H%M%S")
+    output_dir = Path(__file__).parent / "output" / f"{timestamp}_results"
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"\n{'='*60}")
     print(f"TOKN Benchmark - {timestamp}")
     print(f"{'='*60}")
     print(f"Model: {model}")
-    print(f"Prompts: {len(prompts)} total (easy={diff_counts['easy']}, medium={diff_counts['medium']}, hard={diff_counts['hard']})")
+    if prompt_count is None:
+        print(f"Prompts: {prompts_file} (counted as read)")
+    else:
+        print(f"Prompts: {prompt_count} total")
     print(f"Output: {output_dir}")
     print(f"AI Scoring: {'enabled' if run_ai_scores else 'disabled'}")
+    print(f"Generation: {'Batch API' if batch_api else f'concurrency={concurrency}'}")
     print(f"{'='*60}\n")
 
-    results = []
     start_run_time = time.time()
 
-    for i, prompt_data in enumerate(prompts):
-        prompt = prompt_data['prompt']
-        difficulty = prompt_data.get('difficulty', 'unknown')
-        print(f"[{i+1}/{len(prompts)}] [{difficulty}] {prompt[:60]}...")
-
-        # Generate TOKN
-        raw_response, gen_time = generate_tokn(prompt, model)
-        tokn_text = extract_tokn(raw_response)
-
-        # Static validation
-        required_ics = prompt_data.get('required_ics', [])
-        required_components = prompt_data.get('required_components', [])
-
-        if tokn_text:
-            validation = validate_tokn(tokn_text, required_ics=required_ics, required_components=required_components)
+    # Each generation is validated, scored and saved as soon as it arrives,
+    # while the remaining requests are still in flight. all_results.jsonl
+    # (line buffered) stays in prompt order: a result that finishes ahead of
+    # an earlier prompt waits in unwritten until the gap fills. An interrupted
+    # run keeps every result written so far, and only the summary totals and
+    # those waiting rows are kept in memory.
+    totals = SummaryTotals()
+    diff_counts = {'easy': 0, 'medium': 0, 'hard': 0}
+    pending: dict[int, dict] = {}  # Prompts read but not yet processed, by index
+    unwritten: dict[int, str] = {}  # all_results.jsonl lines waiting for earlier prompts
+    next_row = 0  # Index of the next line to write to all_results.jsonl
+
+    def prompt_texts() -> Iterator[str]:
+        """Yield each prompt's text, recording it and counting its difficulty."""
+        for i, prompt_data in enumerate(prompts):
+            pending[i] = prompt_data
+            diff = prompt_data.get('difficulty', 'unknown')
+            if diff in diff_counts:
+                diff_counts[diff] += 1
+            yield prompt_data['prompt']
+
+    with open(output_dir / "all_results.jsonl", 'w', encoding='utf-8', buffering=1) as results_file:
+
+        def process(i: int, raw_response: str, gen_time: float) -> None:
+            """Validate, score and save the generation for prompt i."""
+            nonlocal next_row
+            prompt_data = pending.pop(i)
+            prompt = prompt_data['prompt']
+            difficulty = prompt_data.get('difficulty', 'unknown')
+            position = f"{i+1}/{prompt_count}" if prompt_count is not None else f"{i+1}"
+            print(f"[{position}] [{difficulty}] {prompt[:60]}...")
+
+            tokn_text = extract_tokn(raw_response)
+
+            # Static validation
+            required_ics = prompt_data.get('required_ics', [])
+            required_components = prompt_data.get('required_components', [])
+
+            if tokn_text:
+                validation = validate_tokn(tokn_text, required_ics=required_ics, required_components=required_components)
+            else:
+                validation = ValidationResult(valid=False, syntax_valid=False, requirement_score=0.0)
+
+            # Build result
+            result = PromptResult(
+                prompt_id=i,
+                prompt=prompt,
+                prompt_style=difficulty,
+                required_ics=required_ics,
+                required_components=required_components,
+                generated_tokn=tokn_text,
+                generation_time_ms=gen_time,
+                static_score=validation.score(),
+                syntax_valid=validation.syntax_valid,
+                semantic_valid=validation.semantic_valid,
+                requirement_score=validation.requirement_score,
+                matched_requirements=validation.matched_requirements,
+                missing_requirements=validation.missing_requirements,
+                validation_errors=validation.semantic_errors + validation.syntax_errors,
+                validation_warnings=validation.semantic_warnings + validation.completeness_warnings,
+                subcircuit_name=prompt_data.get('metadata', {}).get('subcircuit_name', ''),
+                model_name=model,
+            )
+
+            # Print static scores
+            req_pct = f"Req:{validation.requirement_score:.0%}" if required_components else ""
+            print(f"  Static: {validation.score():.2f} {req_pct} ({gen_time:.0f}ms)")
+
+            # AI scoring
+            if run_ai_scores and tokn_text:
+                print(f"  Running AI scoring...")
+                ai_result = run_ai_scoring(prompt, tokn_text)
+                result.ai_functionality_score = ai_result.get('functionality_score', 0)
+                result.ai_completeness_score = ai_result.get('completeness_score', 0)
+                result.ai_correctness_score = ai_result.get('correctness_score', 0)
+                result.ai_best_practices_score = ai_result.get('best_practices_score', 0)
+                result.ai_overall_score = ai_result.get('overall_score', 0.0)
+                result.ai_issues = ai_result.get('issues', [])
+                result.ai_suggestions = ai_result.get('suggestions', [])
+                result.ai_explanation = ai_result.get('explanation', '')
+                print(f"  AI: {result.ai_overall_score:.0f}/100 (func={result.ai_functionality_score}, comp={result.ai_completeness_score}, corr={result.ai_correctness_score}, bp={result.ai_best_practices_score})")
+
+            # Save individual result
+            result_dir = output_dir / f"{i:03d}_{difficulty}"
+            result_dir.mkdir(exist_ok=True)
+
+            # Save prompt
+            with open(result_dir / "prompt.txt", 'w', encoding='utf-8') as f:
+                f.write(prompt)
+
+            # Save generated TOKN
+            with open(result_dir / "output.tokn", 'w', encoding='utf-8') as f:
+                f.write(tokn_text if tokn_text else "# Generation failed")
+
+            # Save full result JSON
+            result_dict = result.to_dict()
+            with open(result_dir / "result.json", 'w', encoding='utf-8') as f:
+                json.dump(result_dict, f, indent=2, ensure_ascii=False)
+
+            unwritten[i] = json.dumps(result_dict, ensure_ascii=False) + '\n'
+            while next_row in unwritten:
+                results_file.write(unwritten.pop(next_row))
+                next_row += 1
+            totals.add(result)
+
+        # Generate TOKN for every prompt concurrently, or as one Batch API job
+        # (whose results all arrive when the job ends)
+        if batch_api:
+            generations = generate_tokn_batch_api(list(prompt_texts()), model)
+            for i, (raw_response, gen_time) in enumerate(generations):
+                process(i, raw_response, gen_time)
         else:
-            validation = ValidationResult(valid=False, syntax_valid=False, requirement_score=0.0)
-
-        # Build result
-        result = PromptResult(
-            prompt_id=i,
-            prompt=prompt,
-            prompt_style=difficulty,
-            required_ics=required_ics,
-            required_components=required_components,
-            generated_tokn=tokn_text,
-            generation_time_ms=gen_time,
-            static_score=validation.score(),
-            syntax_valid=validation.syntax_valid,
-            semantic_valid=validation.semantic_valid,
-            requirement_score=validation.requirement_score,
-            matched_requirements=validation.matched_requirements,
-            missing_requirements=validation.missing_requirements,
-            validation_errors=validation.semantic_errors + validation.syntax_errors,
-            validation_warnings=validation.semantic_warnings + validation.completeness_warnings,
-            subcircuit_name=prompt_data.get('metadata', {}).get('subcircuit_name', ''),
-            model_name=model,
-        )
-
-        # Print static scores
-        req_pct = f"Req:{validation.requirement_score:.0%}" if required_components else ""
-        print(f"  Static: {validation.score():.2f} {req_pct} ({gen_time:.0f}ms)")
-
-        # AI scoring
-        if run_ai_scores and tokn_text:
-            print(f"  Running AI scoring...")
-            ai_result = run_ai_scoring(prompt, tokn_text)
-            result.ai_functionality_score = ai_result.get('functionality_score', 0)
-            result.ai_completeness_score = ai_result.get('completeness_score', 0)
-            result.ai_correctness_score = ai_result.get('correctness_score', 0)
-            result.ai_best_practices_score = ai_result.get('best_practices_score', 0)
-            result.ai_overall_score = ai_result.get('overall_score', 0.0)
-            result.ai_issues = ai_result.get('issues', [])
-            result.ai_suggestions = ai_result.get('suggestions', [])
-            result.ai_explanation = ai_result.get('explanation', '')
-            print(f"  AI: {result.ai_overall_score:.0f}/100 (func={result.ai_functionality_score}, comp={result.ai_completeness_score}, corr={result.ai_correctness_score}, bp={result.ai_best_practices_score})")
-
-        results.append(result)
-
-        # Save individual result
-        result_dir = output_dir / f"{i:03d}_{difficulty}"
-        result_dir.mkdir(exist_ok=True)
-
-        # Save prompt
-        with open(result_dir / "prompt.txt", 'w', encoding='utf-8') as f:
-            f.write(prompt)
-
-        # Save generated TOKN
-        with open(result_dir / "output.tokn", 'w', encoding='utf-8') as f:
-            f.write(tokn_text if tokn_text else "# Generation failed")
-
-        # Save full result JSON
-        with open(result_dir / "result.json", 'w', encoding='utf-8') as f:
-            json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+            asyncio.run(generate_tokn_stream(
+                prompt_texts(), model, process, concurrency=concurrency, max_attempts=max_attempts
+            ))
 
     total_run_time = time.time() - start_run_time
 
-    # Calculate summary
     summary = BenchmarkSummary(
         timestamp=timestamp,
         model_name=model,
-        total_prompts=len(results),
+        total_prompts=totals.count,
         easy_count=diff_counts['easy'],
         medium_count=diff_counts['medium'],
         hard_count=diff_counts['hard'],
-        syntax_valid_count=sum(1 for r in results if r.syntax_valid),
-        semantic_valid_count=sum(1 for r in results if r.semantic_valid),
-        avg_static_score=sum(r.static_score for r in results) / len(results) if results else 0,
-        avg_requirement_score=sum(r.requirement_score for r in results) / len(results) if results else 0,
-        avg_ai_functionality=sum(r.ai_functionality_score for r in results) / len(results) if results else 0,
-        avg_ai_completeness=sum(r.ai_completeness_score for r in results) / len(results) if results else 0,
-        avg_ai_correctness=sum(r.ai_correctness_score for r in results) / len(results) if results else 0,
-        avg_ai_best_practices=sum(r.ai_best_practices_score for r in results) / len(results) if results else 0,
-        avg_ai_overall=sum(r.ai_overall_score for r in results) / len(results) if results else 0,
-        avg_generation_time_ms=sum(r.generation_time_ms for r in results) / len(results) if results else 0,
         total_run_time_s=total_run_time,
     )
-
-    # Scores by difficulty
-    for diff in ['easy', 'medium', 'hard']:
-        diff_results = [r for r in results if r.prompt_style == diff]
-        if diff_results:
-            summary.scores_by_difficulty[diff] = {
-                'count': len(diff_results),
-                'avg_static_score': sum(r.static_score for r in diff_results) / len(diff_results),
-                'avg_ai_overall': sum(r.ai_overall_score for r in diff_results) / len(diff_results),
-            }
+    totals.fill(summary)
 
     # Save summary
     with open(output_dir / "summary.json", 'w', encoding='utf-8') as f:
         json.dump(summary.to_dict(), f, indent=2)
 
-    # Save all results as JSONL
-    with open(output_dir / "all_results.jsonl", 'w', encoding='utf-8') as f:
-        for r in results:
-            f.write(json.dumps(r.to_dict(), ensure_ascii=False) + '\n')
-
     # Print summary
     print(f"\n{'='*60}")
     print("BENCHMARK SUMMARY")
     print(f"{'='*60}")
     print(f"Model: {model}")
-    print(f"Total prompts: {len(results)}")
+    print(f"Total prompts: {summary.total_prompts} (easy={summary.easy_count}, medium={summary.medium_count}, hard={summary.hard_count})")
     print(f"Run time: {total_run_time:.1f}s")
     print(f"\nStatic Validation:")
-    print(f"  Syntax valid: {summary.syntax_valid_count}/{len(results)} ({100*summary.syntax_valid_count/len(results):.1f}%)")
-    print(f"  Semantic valid: {summary.semantic_valid_count}/{len(results)} ({100*summary.semantic_valid_count/len(results):.1f}%)")
+    print(f"  Syntax valid: {summary.syntax_valid_count}/{summary.total_prompts} ({100*summary.syntax_valid_count/summary.total_prompts:.1f}%)")
+    print(f"  Semantic valid: {summary.semantic_valid_count}/{summary.total_prompts} ({100*summary.semantic_valid_count/summary.total_prompts:.1f}%)")
     print(f"  Avg static score: {summary.avg_static_score:.3f}")
     print(f"  Avg requirement score: {summary.avg_requirement_score:.3f}")
 
@@ -608,6 +875,8 @@ Examples:
   python runner.py -e 10 -H 5        # 10 easy + 5 hard (no medium)
   python runner.py --prompts file.jsonl  # Custom prompts file
   python runner.py -e 2 -m 2 -H 2 --no-ai  # Skip AI scoring
+  python runner.py -e --concurrency 4  # Fewer requests in flight (low rate limits)
+  python runner.py -e -m -H --model openai/gpt-4o --batch-api  # Half-price Batch API run
   python runner.py -e 5 --model cerebras/llama-4-scout-17b-16e-instruct  # Use Cerebras
 
 Providers:
@@ -638,6 +907,13 @@ Output structure:
     parser.add_argument('--model', default='google/gemini-2.5-flash',
                         help='Model to use (prefix with "cerebras/" for Cerebras API)')
     parser.add_argument('--no-ai', action='store_true', help='Skip AI scoring')
+    parser.add_argument('--concurrency', type=int, default=16,
+                        help='Maximum generation requests in flight at once (default: 16)')
+    parser.add_argument('--max-attempts', type=int, default=5,
+                        help='Attempts per generation request on rate limit or server errors (default: 5)')
+    parser.add_argument('--batch-api', action='store_true',
+                        help='Generate with one OpenAI/Anthropic Batch API job (~50%% cheaper, up to 24h; '
+                             'needs an openai/ or anthropic/ model and OPENAI_API_KEY or ANTHROPIC_API_KEY)')
 
     # Difficulty flags
     parser.add_argument('-e', '--easy', type=int, nargs='?', const=-1, default=0,
@@ -663,6 +939,9 @@ Output structure:
         model=args.model,
         run_ai_scores=not args.no_ai,
         prompts_file=args.prompts,
+        concurrency=args.concurrency,
+        max_attempts=args.max_attempts,
+        batch_api=args.batch_api,
     )
 
 
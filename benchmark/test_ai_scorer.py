@@ -3,7 +3,11 @@ Quick test for AI scorer functionality.
 This doesn't call the API, just tests the structure.
 """
 
-from ai_scorer import AIScoreResult, AI_SCORER_SYSTEM_PROMPT
+import os
+import tempfile
+
+from ai_scorer import AIScoreResult, AI_SCORER_SYSTEM_PROMPT, AI_SCORE_SCHEMA, summarize_scores
+from ai_scorer import _cache_load, _cache_store, _parse_score_response
 
 def test_dataclass():
     """Test AIScoreResult dataclass."""
@@ -38,6 +42,19 @@ def test_system_prompt():
     print("[PASS] System prompt contains all required scoring criteria")
     print(f"  Prompt length: {len(AI_SCORER_SYSTEM_PROMPT)} chars")
 
+def test_system_prompt_schema():
+    """Test that the compressed system prompt still requests every schema key."""
+    for key in ["issues", "suggestions", "explanation"]:
+        assert f'"{key}"' in AI_SCORER_SYSTEM_PROMPT
+    # The structured-output schema must ask for exactly the keys the prompt describes
+    assert set(AI_SCORE_SCHEMA['required']) == set(AI_SCORE_SCHEMA['properties'])
+    for key in AI_SCORE_SCHEMA['required']:
+        assert f'"{key}"' in AI_SCORER_SYSTEM_PROMPT
+    assert "Return ONLY the JSON object" in AI_SCORER_SYSTEM_PROMPT
+    # Sent with every request, so keep it under ~1000 tokens (~4 chars/token)
+    assert len(AI_SCORER_SYSTEM_PROMPT) < 4000
+    print("[PASS] System prompt requests the full JSON schema")
+
 def test_weighted_average():
     """Test that weighted average is calculated correctly."""
     # Expected: 0.35*80 + 0.25*60 + 0.25*70 + 0.15*50
@@ -59,6 +76,77 @@ def test_weighted_average():
     print("[PASS] Weighted average calculation verified")
     print(f"  Expected: {expected}, Got: {result.overall_score}")
 
+def test_summarize_scores():
+    """Test summary averages and distribution buckets, skipping zero scores."""
+    def score(overall, func=80):
+        return AIScoreResult(
+            functionality_score=func,
+            completeness_score=60,
+            correctness_score=70,
+            best_practices_score=50,
+            overall_score=overall,
+            issues=[],
+            suggestions=[],
+            explanation="Test"
+        )
+
+    scores = [score(100.0), score(90.0), score(89.99, 60), score(50.0), score(49.5), score(0.0, 0)]
+    summary = summarize_scores(scores, "test-model")
+
+    assert summary['model'] == "test-model"
+    assert summary['total_scored'] == 6
+    assert summary['valid_scores'] == 5
+    assert abs(summary['avg_overall_score'] - (100 + 90 + 89.99 + 50 + 49.5) / 5) < 1e-6
+    assert summary['avg_functionality'] == 76
+    assert summary['score_distribution'] == {
+        '90-100': 2, '80-89': 1, '70-79': 0, '60-69': 0, '50-59': 1, '0-49': 1
+    }
+    assert summarize_scores([], "m")['avg_overall_score'] == 0
+    print("[PASS] Summary statistics computed correctly")
+
+def test_cache_store_best_effort():
+    """Test that a failed cache write is skipped without raising or leaving tmp files."""
+    result = AIScoreResult(
+        functionality_score=80,
+        completeness_score=60,
+        correctness_score=70,
+        best_practices_score=50,
+        overall_score=68.0,
+        issues=[],
+        suggestions=[],
+        explanation="Test"
+    )
+    with tempfile.TemporaryDirectory() as cache_dir:
+        _cache_store(cache_dir, "ok", result)
+        assert _cache_load(cache_dir, "ok") == result
+
+        # A directory where the cache file should go makes the final rename fail
+        os.makedirs(os.path.join(cache_dir, "blocked.json", "child"))
+        _cache_store(cache_dir, "blocked", result)
+        assert sorted(os.listdir(cache_dir)) == ["blocked.json", "ok.json"]
+
+        # A file where the cache directory should go makes mkdir fail
+        _cache_store(os.path.join(cache_dir, "ok.json", "sub"), "k", result)
+    print("[PASS] Cache writes are best-effort")
+
+def test_partial_response_flagged():
+    """Test that scores recovered from truncated JSON are reported as incomplete."""
+    reply = ('{"functionality_score": 80, "completeness_score": 60, "correctness_score": 70, '
+             '"best_practices_score": 50, "issues": ["Missing cap"], "suggestions": [], "explanation": "ok"}')
+
+    result, complete = _parse_score_response(reply)
+    assert complete and result.issues == ["Missing cap"]
+
+    result, complete = _parse_score_response("```json\n" + reply + "\n```")
+    assert complete and result.explanation == "ok"
+
+    # Cut off inside the issues array: scores survive, issues/explanation don't
+    result, complete = _parse_score_response(reply[:reply.index('"Missing') + 5])
+    assert not complete
+    assert result.functionality_score == 80 and result.best_practices_score == 50
+    assert result.issues == [] and result.explanation.startswith("(Partial response")
+    print("[PASS] Truncated replies are flagged as incomplete (not cached)")
+
 if __name__ == '__main__':
     print("Testing AI Scorer components...")
     print()
@@ -66,6 +154,14 @@ if __name__ == '__main__':
     print()
     test_system_prompt()
     print()
+    test_system_prompt_schema()
+    print()
     test_weighted_average()
     print()
+    test_summarize_scores()
+    print()
+    test_cache_store_best_effort()
+    print()
+    test_partial_response_flagged()
+    print()
     print("All tests passed!")
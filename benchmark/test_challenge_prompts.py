@@ -0,0 +1,62 @@
+"""
+Tests for matching challenge prompt requirements in TOKN text.
+"""
+
+import challenge_prompts
+from challenge_prompts import CHALLENGE_PROMPTS, check_required
+
+def _check_fallback(prompt: dict, tokn: str) -> set[str]:
+    """check_required with the substring fallback forced."""
+    required_automaton = challenge_prompts._required_automaton
+    challenge_prompts._required_automaton = lambda required: None
+    try:
+        return check_required(prompt, tokn)
+    finally:
+        challenge_prompts._required_automaton = required_automaton
+
+def _texts(prompt: dict) -> list[str]:
+    """TOKN-like texts with none, some and all of a prompt's components."""
+    required = prompt['required_components']
+    return [
+        "",
+        "# TOKN v1\ncomponents[0]{ref,type,value}:",
+        prompt['prompt'],
+        "\n".join(required[::2]),
+        ",".join(required),
+    ]
+
+def test_check_required():
+    """Test check_required against the substring fallback for every challenge prompt."""
+    has_automaton = challenge_prompts._required_automaton(('x',)) is not None
+    for prompt in CHALLENGE_PROMPTS:
+        for tokn in _texts(prompt):
+            expected = {s for s in prompt['required_components'] if s in tokn}
+            assert _check_fallback(prompt, tokn) == expected
+            assert check_required(prompt, tokn) == expected, (prompt['prompt'][:40], tokn[:40])
+
+        assert check_required(prompt, ",".join(prompt['required_components'])) == set(prompt['required_components'])
+    print("[PASS] check_required matches the substring fallback")
+    print(f"  Automaton: {'pyahocorasick' if has_automaton else 'not installed'}")
+
+def test_check_required_edge_cases():
+    """Test empty requirement lists and empty-string components."""
+    assert check_required({'required_components': []}, "anything") == set()
+
+    # An empty component is in every text, as with a substring check
+    for required in ([''], ['', '10k'], ['10k', '', '10k', '100nF']):
+        prompt = {'required_components': required}
+        for tokn in ("", "R1,R,10k", "C1,C,100nF\nR1,R,10k"):
+            expected = {s for s in required if s in tokn}
+            assert '' in expected
+            assert check_required(prompt, tokn) == expected, (required, tokn)
+            assert _check_fallback(prompt, tokn) == expected
+    print("[PASS] check_required handles empty and empty-string requirements")
+
+if __name__ == '__main__':
+    print("Testing challenge prompt requirement checks...")
+    print()
+    test_check_required()
+    print()
+    test_check_required_edge_cases()
+    print()
+    print("All tests passed!")
@@ -0,0 +1,57 @@
+"""
+Tests for the issue classification used in the scoring examples.
+"""
+
+import example_usage
+from example_usage import classify_issue
+
+ISSUES = [
+    "Missing decoupling capacitor on U1",
+    "No decoupling on VCC pin 8",  # All four categories; decoupling wins
+    "Pin 4 (RESET) tied to GND via a resistor",  # Pin first in the text; power wins
+    "Resistor R3 on pin 3 is too large",  # Resistor before pin
+    "LED resistor missing; add DECOUPLING near the power pins",
+    "Spin-up Vcc ramp too slow",  # 'pin' inside 'Spin', then vcc
+    "Pinout of J1 does not match the footprint",
+    "Power rail unlabelled",
+    "Crystal load capacitors are missing",  # No category
+    "",
+]
+
+def _ordered_checks(issue: str):
+    """The original if/elif chain over the lowered issue text."""
+    lower = issue.lower()
+    if 'decoupling' in lower:
+        return 'Decoupling capacitors'
+    elif 'power' in lower or 'vcc' in lower or 'gnd' in lower:
+        return 'Power connections'
+    elif 'resistor' in lower:
+        return 'Resistor values'
+    elif 'pin' in lower:
+        return 'Pin connections'
+    return None
+
+def test_classify_issue():
+    """Test that classify_issue follows category priority, with and without the automaton."""
+    automaton = example_usage._ISSUE_AUTOMATON
+    expected = [_ordered_checks(issue) for issue in ISSUES]
+    assert expected[:5] == ['Decoupling capacitors', 'Decoupling capacitors', 'Power connections',
+                            'Resistor values', 'Decoupling capacitors']
+    assert expected[-2:] == [None, None]
+
+    assert [classify_issue(issue) for issue in ISSUES] == expected
+
+    example_usage._ISSUE_AUTOMATON = None  # Force the per-category fallback
+    try:
+        assert [classify_issue(issue) for issue in ISSUES] == expected
+    finally:
+        example_usage._ISSUE_AUTOMATON = automaton
+    print("[PASS] classify_issue picks the highest-priority category")
+    print(f"  Automaton: {'pyahocorasick' if automaton is not None else 'not installed'}")
+
+if __name__ == '__main__':
+    print("Testing issue classification...")
+    print()
+    test_classify_issue()
+    print()
+    print("All tests passed!")
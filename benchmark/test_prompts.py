@@ -0,0 +1,163 @@
+"""
+Tests for loading benchmark prompts from the SQLite database.
+Builds a small temporary database instead of using the real one.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+import prompts
+from prompts import load_benchmark_prompts
+
+def _subcircuit(name: str, components: str) -> dict:
+    return {"name": name, "description": f"A {name}.", "useCase": "power a board",
+            "components": components, "tags": ["power"]}
+
+GOOD = "U1 (LM7805), C1 (10uF), C2 (100nF)"
+
+# (file id, classification_score, tokn, classification_data)
+FILES = [
+    (1, 9.9, "# TOKN v1", "{not json"),  # Malformed JSON
+    (2, 9.8, "# TOKN v1", None),  # NULL classification
+    (3, 9.7, "# TOKN v1", json.dumps({"subcircuits": []})),  # No subcircuits
+    (4, 9.6, None, json.dumps({"subcircuits": [_subcircuit("no tokn", GOOD)]})),  # No TOKN
+    (5, 9.5, "# TOKN v1 five", json.dumps({"subcircuits": [
+        _subcircuit("regulator 5a", GOOD),
+        _subcircuit("passives only", "R1 (10k), R2 (4.7k), C1 (100nF)"),  # No IC
+        _subcircuit("short", "U1 (X)"),  # Component string too short
+        _subcircuit("ic only", "U1 (LM7805)"),  # Fewer than 2 parts
+        _subcircuit("regulator 5b", "U2 (AMS1117-3.3), C3 (22uF)"),
+    ]})),
+    (6, 8.0, "# TOKN v1 six", json.dumps({"subcircuits": [
+        _subcircuit(f"regulator 6{c}", GOOD) for c in "abcdefgh"
+    ]})),
+    (7, 4.0, "# TOKN v1", json.dumps({"subcircuits": [_subcircuit("low score", GOOD)]})),  # Below min_score
+]
+# Subcircuits that pass every filter, by file id
+ELIGIBLE = {5: 2, 6: 8}
+
+def _make_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE repositories (id INTEGER PRIMARY KEY, full_name TEXT)")
+    conn.execute("""CREATE TABLE files (id INTEGER PRIMARY KEY, repo_id INTEGER, file_name TEXT,
+                    tokn TEXT, classification_data TEXT, classification_score REAL)""")
+    conn.execute("INSERT INTO repositories VALUES (1, 'example/board')")
+    conn.executemany("INSERT INTO files VALUES (?, 1, ?, ?, ?, ?)",
+                     [(i, f"board{i}.kicad_sch", tokn, data, score) for i, score, tokn, data in FILES])
+    conn.commit()
+    conn.close()
+
+def _key(p) -> tuple:
+    return (p.file_id, p.subcircuit_name, p.prompt, p.prompt_style)
+
+def _with_db(test):
+    """Run test(db_path) against a fresh database, closing its shared connection afterwards."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "kicad_repos.db")
+        _make_db(db_path)
+        try:
+            test(db_path)
+        finally:
+            conn, _ = prompts._CONNECTIONS.pop(str(Path(db_path).resolve()))
+            conn.close()
+
+def test_filters():
+    """Test that invalid, empty, tokn-less and low-score rows and weak subcircuits are dropped."""
+    def check(db_path):
+        loaded = load_benchmark_prompts(db_path, limit=100)
+        counts = {}
+        for p in loaded:
+            counts[p.file_id] = counts.get(p.file_id, 0) + 1
+        assert counts == ELIGIBLE
+
+        five = sorted((p for p in loaded if p.file_id == 5), key=lambda p: p.subcircuit_name)
+        assert [p.subcircuit_name for p in five] == ["regulator 5a", "regulator 5b"]
+        assert five[1].required_ics == ["AMS1117-3.3"]
+        assert five[1].required_components == ["AMS1117-3.3", "22uF"]
+        assert five[0].reference_tokn == "# TOKN v1 five"
+        assert five[0].repo == "example/board" and five[0].score == 9.5
+        assert all(p.prompt_style in prompts.PROMPT_STYLES for p in loaded)
+
+        assert load_benchmark_prompts(db_path, min_score=9.9, limit=100) == []
+        print("[PASS] Malformed, NULL and empty classifications are filtered")
+        print(f"  Prompts per file: {counts}")
+    _with_db(check)
+
+def test_limits():
+    """Test limit and max_files."""
+    def check(db_path):
+        assert len(load_benchmark_prompts(db_path, limit=3)) == 3
+        assert len(load_benchmark_prompts(db_path, limit=10)) == 10
+        assert load_benchmark_prompts(db_path, limit=0) == []
+
+        # The SQL filter runs before LIMIT, so the top file is the best valid one
+        top = load_benchmark_prompts(db_path, limit=100, max_files=1)
+        assert {p.file_id for p in top} == {5} and len(top) == ELIGIBLE[5]
+        assert len(load_benchmark_prompts(db_path, limit=100, max_files=2)) == sum(ELIGIBLE.values())
+        print("[PASS] limit and max_files are respected")
+    _with_db(check)
+
+def test_sampling():
+    """Test that sampling is deterministic for a seed and returns distinct subcircuits."""
+    def check(db_path):
+        first = [_key(p) for p in load_benchmark_prompts(db_path, limit=4, seed=7)]
+        again = [_key(p) for p in load_benchmark_prompts(db_path, limit=4, seed=7)]
+        assert first == again
+        assert len(first) == 4 and len({(k[0], k[1]) for k in first}) == 4
+
+        samples = {tuple(_key(p) for p in load_benchmark_prompts(db_path, limit=4, seed=s)) for s in range(10)}
+        assert len(samples) > 1
+        print("[PASS] Sampling is deterministic per seed")
+    _with_db(check)
+
+def test_shared_connection():
+    """Test that repeated and concurrent loads share one connection safely."""
+    def check(db_path):
+        expected = [_key(p) for p in load_benchmark_prompts(db_path, limit=5)]
+        key = str(Path(db_path).resolve())
+        conn = prompts._CONNECTIONS[key][0]
+
+        # A relative path to the same file reuses the connection
+        relative = os.path.relpath(db_path)
+        assert [_key(p) for p in load_benchmark_prompts(relative, limit=5)] == expected
+        assert prompts._CONNECTIONS[key][0] is conn
+
+        # load_benchmark_prompts seeds the global random module, so threads
+        # only compare sizes and files; the connection lock keeps queries apart
+        errors = []
+        sizes = []
+
+        def load():
+            try:
+                loaded = load_benchmark_prompts(db_path, limit=100)
+                sizes.append((len(loaded), {p.file_id for p in loaded}))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert sizes == [(sum(ELIGIBLE.values()), set(ELIGIBLE))] * 8
+        assert prompts._CONNECTIONS[key][0] is conn
+        print("[PASS] Repeated and concurrent loads share one connection")
+    _with_db(check)
+
+if __name__ == '__main__':
+    print("Testing benchmark prompt loading...")
+    print()
+    test_filters()
+    print()
+    test_limits()
+    print()
+    test_sampling()
+    print()
+    test_shared_connection()
+    print()
+    print("All tests passed!")
@@ -0,0 +1,109 @@
+"""
+Tests for the medium prompt categories and lookups.
+"""
+
+import prompts_medium
+from prompts_medium import CATEGORIES, MEDIUM_PROMPTS, PROMPTS_PER_CATEGORY, by_category
+from prompts_medium import find_by_ic, find_by_ics, find_by_tag, find_by_tags, find_ics_in_text
+
+def _scan(predicate) -> tuple[int, ...]:
+    """Indices of the prompts matching predicate, found by a full scan."""
+    return tuple(i for i, p in enumerate(MEDIUM_PROMPTS) if predicate(p))
+
+def test_find_by_ic():
+    """Test single-IC and multi-IC lookups."""
+    assert find_by_ic('STM32F103C8T6') == (0,)
+    assert find_by_ic('AMS1117-3.3') == (40, 59)
+    assert find_by_ic('NO-SUCH-IC') == ()
+
+    for ic in {ic for p in MEDIUM_PROMPTS for ic in p.required_ics}:
+        assert find_by_ic(ic) == _scan(lambda p: ic in p.required_ics), ic
+
+    assert find_by_ics(['INA219', 'AMS1117-3.3']) == (40,)
+    assert find_by_ics(['STM32F103C8T6', 'APX803']) == (0,)
+    assert find_by_ics(['STM32F103C8T6', 'INA219']) == ()
+    assert find_by_ics(['INA219', 'NO-SUCH-IC']) == ()
+    assert find_by_ics([]) == ()
+    assert find_by_ics(iter(['AMS1117-3.3'])) == (40, 59)
+    print("[PASS] find_by_ic / find_by_ics match a full scan")
+
+def test_find_by_tag():
+    """Test single-tag and multi-tag lookups."""
+    assert len(find_by_tag('i2c')) == 19
+    assert len(find_by_tag('usb')) == 11
+    assert find_by_tag('no-such-tag') == ()
+
+    for tag in {tag for p in MEDIUM_PROMPTS for tag in p.subcircuit_tags}:
+        assert find_by_tag(tag) == _scan(lambda p: tag in p.subcircuit_tags), tag
+
+    assert find_by_tags(['usb', 'esd']) == (80, 81, 88)
+    assert find_by_tags(['mcu', 'crystal']) == _scan(
+        lambda p: 'mcu' in p.subcircuit_tags and 'crystal' in p.subcircuit_tags)
+    assert find_by_tags(['usb', 'no-such-tag']) == ()
+    assert find_by_tags([]) == ()
+    print("[PASS] find_by_tag / find_by_tags match a full scan")
+    print(f"  Tags 'usb'+'esd': {find_by_tags(['usb', 'esd'])}")
+
+def test_find_ics_in_text():
+    """Test find_ics_in_text with and without the automaton."""
+    ics = sorted({ic for p in MEDIUM_PROMPTS for ic in p.required_ics})
+    texts = [p.prompt for p in MEDIUM_PROMPTS] + [
+        "",
+        "no parts here",
+        " / ".join(ics),  # Every IC, including ones that contain another
+        "U1 is an INA219; U2 is an AMS1117-3.3 regulator",
+    ]
+
+    ic_automaton = prompts_medium._ic_automaton
+    automaton = ic_automaton()
+    prompts_medium._ic_automaton = lambda: None  # Force the substring fallback
+    try:
+        fallback = [find_ics_in_text(text) for text in texts]
+    finally:
+        prompts_medium._ic_automaton = ic_automaton
+
+    for text, expected in zip(texts, fallback):
+        assert expected == {ic for ic in ics if ic in text}
+        if automaton is not None:
+            assert find_ics_in_text(text) == expected, text[:60]
+
+    assert fallback[-4:-2] == [set(), set()]
+    assert fallback[-2] == set(ics)
+    assert {'INA219', 'AMS1117-3.3'} <= fallback[-1]
+    assert find_by_ics(fallback[-1]) == (40,)
+    print("[PASS] find_ics_in_text matches the substring fallback")
+    print(f"  Automaton: {'pyahocorasick' if automaton is not None else 'not installed'}")
+
+def test_by_category():
+    """Test that the categories slice MEDIUM_PROMPTS in order, and unknown names."""
+    assert len(MEDIUM_PROMPTS) == len(CATEGORIES) * PROMPTS_PER_CATEGORY
+
+    slices = [by_category(category) for category in CATEGORIES]
+    assert all(len(prompts) == PROMPTS_PER_CATEGORY for prompts in slices)
+    assert [p for prompts in slices for p in prompts] == MEDIUM_PROMPTS
+
+    assert by_category('MCU Minimal Systems')[0].required_ics == ('STM32F103C8T6', 'APX803')
+    assert by_category('USB Interfaces')[0].subcircuit_name == "USB-UART with ESD protection"
+    assert by_category('Battery Charging')[-1] is MEDIUM_PROMPTS[-1]
+
+    for category in ('Unknown', 'usb interfaces', ''):
+        try:
+            by_category(category)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"by_category({category!r}) did not raise")
+    print("[PASS] by_category slices MEDIUM_PROMPTS by category")
+
+if __name__ == '__main__':
+    print("Testing medium prompt lookups...")
+    print()
+    test_find_by_ic()
+    print()
+    test_find_by_tag()
+    print()
+    test_find_ics_in_text()
+    print()
+    test_by_category()
+    print()
+    print("All tests passed!")
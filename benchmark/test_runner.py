@@ -0,0 +1,132 @@
+"""
+Tests for the benchmark runner's result bookkeeping and TOKN extraction.
+These don't call any API.
+"""
+
+from runner import BenchmarkSummary, PromptResult, SummaryTotals, extract_tokn
+
+def _summary() -> BenchmarkSummary:
+    return BenchmarkSummary(timestamp="t", model_name="m", total_prompts=0,
+                            easy_count=0, medium_count=0, hard_count=0)
+
+def _results() -> list[PromptResult]:
+    styles = ['easy', 'medium', 'hard', 'medium', 'unknown', 'easy', 'expert']
+    return [
+        PromptResult(
+            prompt_id=i,
+            prompt=f"p{i}",
+            prompt_style=style,
+            generation_time_ms=100.0 + 37.5 * i,
+            static_score=0.1 * i,
+            syntax_valid=i % 2 == 0,
+            semantic_valid=i % 3 != 0,
+            requirement_score=1.0 / (i + 1),
+            ai_functionality_score=10 * i,
+            ai_completeness_score=90 - 7 * i,
+            ai_correctness_score=50 + i,
+            ai_best_practices_score=3 * i,
+            ai_overall_score=12.5 * i + 0.3,
+        )
+        for i, style in enumerate(styles)
+    ]
+
+def test_summary_totals():
+    """Test SummaryTotals.fill against per-field averages over all results."""
+    results = _results()
+    totals = SummaryTotals()
+    for r in results:
+        totals.add(r)
+    summary = _summary()
+    totals.fill(summary)
+
+    n = len(results)
+    assert summary.total_prompts == n
+    assert summary.syntax_valid_count == sum(1 for r in results if r.syntax_valid)
+    assert summary.semantic_valid_count == sum(1 for r in results if r.semantic_valid)
+    assert summary.avg_static_score == sum(r.static_score for r in results) / n
+    assert summary.avg_requirement_score == sum(r.requirement_score for r in results) / n
+    assert summary.avg_ai_functionality == sum(r.ai_functionality_score for r in results) / n
+    assert summary.avg_ai_completeness == sum(r.ai_completeness_score for r in results) / n
+    assert summary.avg_ai_correctness == sum(r.ai_correctness_score for r in results) / n
+    assert summary.avg_ai_best_practices == sum(r.ai_best_practices_score for r in results) / n
+    assert summary.avg_ai_overall == sum(r.ai_overall_score for r in results) / n
+    assert summary.avg_generation_time_ms == sum(r.generation_time_ms for r in results) / n
+
+    # Only easy/medium/hard are reported; 'unknown' and 'expert' count in the totals only
+    assert list(summary.scores_by_difficulty) == ['easy', 'medium', 'hard']
+    for diff, scores in summary.scores_by_difficulty.items():
+        diff_results = [r for r in results if r.prompt_style == diff]
+        assert scores == {
+            'count': len(diff_results),
+            'avg_static_score': sum(r.static_score for r in diff_results) / len(diff_results),
+            'avg_ai_overall': sum(r.ai_overall_score for r in diff_results) / len(diff_results),
+        }
+    print("[PASS] SummaryTotals matches per-field averages")
+    print(f"  Avg static score: {summary.avg_static_score:.3f}")
+
+def test_summary_totals_empty():
+    """Test SummaryTotals.fill with no results."""
+    summary = _summary()
+    SummaryTotals().fill(summary)
+    assert summary.total_prompts == 0
+    assert summary.syntax_valid_count == 0 and summary.semantic_valid_count == 0
+    assert summary.avg_static_score == 0 and summary.avg_ai_overall == 0
+    assert summary.avg_generation_time_ms == 0
+    assert summary.scores_by_difficulty == {}
+
+    # A difficulty without results is left out
+    totals = SummaryTotals()
+    totals.add(_results()[1])
+    summary = _summary()
+    totals.fill(summary)
+    assert list(summary.scores_by_difficulty) == ['medium']
+    print("[PASS] SummaryTotals handles empty runs and missing difficulties")
+
+TOKN = "# TOKN v1\ncomponents[1]{ref,type,value}:\n  R1,R,10k"
+
+def test_extract_fenced():
+    """Test extracting TOKN from a fenced code block."""
+    for fence in ("```tokn", "```toon", "```"):
+        text = f"Here is the circuit:\n\n{fence}\n{TOKN}\n```\n\nThe resistor sets the current."
+        assert extract_tokn(text) == TOKN, fence
+
+    # A fenced block without the header falls through to the bare header
+    text = f"```python\nprint(1)\n```\n\n{TOKN}\n\nNote: check values"
+    assert extract_tokn(text) == TOKN
+    print("[PASS] Fenced TOKN blocks are extracted")
+
+def test_extract_bare():
+    """Test extracting unfenced TOKN and the empty cases."""
+    assert extract_tokn(f"Sure!\n{TOKN}\n") == TOKN
+    assert extract_tokn(f"Sure!\n{TOKN}\n---\nDone") == TOKN
+    assert extract_tokn(f"{TOKN}\nThis circuit uses R1.") == TOKN
+    assert extract_tokn("") == ""
+    assert extract_tokn("No circuit here\n```\nR1 10k\n```") == ""
+    print("[PASS] Bare TOKN is extracted up to the first end marker")
+
+def test_extract_end_marker_priority():
+    """Test that end markers are tried in priority order, not by position."""
+    # '\nThe ' comes first in the text, but '\n## ' has priority
+    text = f"{TOKN}\nThe divider\n## Explanation\nNote: done"
+    assert extract_tokn(text) == f"{TOKN}\nThe divider"
+
+    # Markers are searched after the header, so a comment straight after it is kept
+    text = f"# TOKN v1\n# comment{TOKN[9:]}"
+    assert extract_tokn(text) == text
+    assert extract_tokn(f"{TOKN}\nNote: a\nThis b") == f"{TOKN}\nNote: a"
+    print("[PASS] End markers are applied in priority order")
+
+if __name__ == '__main__':
+    print("Testing runner components...")
+    print()
+    test_summary_totals()
+    print()
+    test_summary_totals_empty()
+    print()
+    test_extract_fenced()
+    print()
+    test_extract_bare()
+    print()
+    test_extract_end_marker_priority()
+    print()
+    print("All tests passed!")
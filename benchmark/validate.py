@@ -216,6 +216,7 @@ def validate_requirements(
 
     matched = []
     missing = []
+    ic_set = set(required_ics)
 
     # Extract what's in the generated TOKN
     generated_types = set()  # IC part numbers
@@ -241,28 +242,33 @@ def validate_requirements(
         else:
             missing.append(ic)
 
-    # Check other components (values)
+    # Check other components (values). Repeated values (e.g. two 22pF load
+    # caps) are looked up once; each occurrence still counts.
+    found_values = {}
     for comp in required_components:
-        if comp in required_ics:
+        if comp in ic_set:
             continue  # Already checked
 
-        norm_comp = normalize_value(comp)
-        # Check if value is present
-        found = any(norm_comp in gen or gen in norm_comp for gen in generated_values)
+        found = found_values.get(comp)
+        if found is None:
+            norm_comp = normalize_value(comp)
+            # Check if value is present
+            found = found_values[comp] = any(norm_comp in gen or gen in norm_comp for gen in generated_values)
         if found:
             matched.append(comp)
         else:
             missing.append(comp)
 
     # Calculate score
-    total = len(required_ics) + len([c for c in required_components if c not in required_ics])
+    passive_total = sum(1 for c in required_components if c not in ic_set)
+    total = len(required_ics) + passive_total
     if total == 0:
         return 1.0, matched, missing
 
     # ICs are worth more (each IC = 2 points, each passive = 1 point)
-    ic_points = len([m for m in matched if m in required_ics]) * 2
-    passive_points = len([m for m in matched if m not in required_ics])
-    max_points = len(required_ics) * 2 + len([c for c in required_components if c not in required_ics])
+    ic_points = sum(1 for m in matched if m in ic_set) * 2
+    passive_points = sum(1 for m in matched if m not in ic_set)
+    max_points = len(required_ics) * 2 + passive_total
 
     score = (ic_points + passive_points) / max_points if max_points > 0 else 1.0
 